@@ -0,0 +1,79 @@
+"""Micro benchmarks for zhaquirks hot paths.
+
+Benchmarks are not collected by pytest, run them as modules, e.g.
+``python -m tests.benchmarks.bench_philips_remote``.
+"""
+
+from collections.abc import Callable
+import timeit
+
+import zigpy.device
+import zigpy.types
+
+from tests.conftest import MockApp
+from zhaquirks.const import (
+    DEVICE_TYPE,
+    ENDPOINTS,
+    INPUT_CLUSTERS,
+    MANUFACTURER,
+    MODEL,
+    MODELS_INFO,
+    OUTPUT_CLUSTERS,
+    PROFILE_ID,
+)
+
+
+def mock_app() -> MockApp:
+    """Return an application controller that doesn't talk to a radio."""
+    return MockApp({"device": {"path": "/dev/ttyUSB0"}, "database": None})
+
+
+def device_from_quirk(quirk, app=None, ieee=None, nwk=0x1234):
+    """Create a quirked zigpy device from the quirk's signature."""
+    if app is None:
+        app = mock_app()
+    if ieee is None:
+        ieee = zigpy.types.EUI64([1, 2, 3, 4, 5, 6, 7, 8])
+    nwk = zigpy.types.NWK(nwk)
+
+    models_info = quirk.signature.get(
+        MODELS_INFO,
+        (
+            (
+                quirk.signature.get(MANUFACTURER, "Mock Manufacturer"),
+                quirk.signature.get(MODEL, "Mock Model"),
+            ),
+        ),
+    )
+    raw_device = zigpy.device.Device(app, ieee, nwk)
+    raw_device.manufacturer, raw_device.model = models_info[0]
+
+    for ep_id, ep_data in quirk.signature.get(ENDPOINTS, {}).items():
+        ep = raw_device.add_endpoint(ep_id)
+        ep.profile_id = ep_data.get(PROFILE_ID, 0x0260)
+        ep.device_type = ep_data.get(DEVICE_TYPE, 0xFEDB)
+        for cluster_id in ep_data.get(INPUT_CLUSTERS, []):
+            ep.add_input_cluster(cluster_id)
+        for cluster_id in ep_data.get(OUTPUT_CLUSTERS, []):
+            ep.add_output_cluster(cluster_id)
+
+    device = quirk(app, ieee, nwk, raw_device)
+    app.devices[ieee] = device
+    return device
+
+
+def run_sync(async_func, *args, **kwargs):
+    """Run a coroutine function that never suspends without an event loop."""
+    coro = async_func(*args, **kwargs)
+    try:
+        coro.send(None)
+    except StopIteration as exc:
+        return exc.value
+    raise RuntimeError("coroutine suspended")
+
+
+def report(name: str, func: Callable[[], object], number: int = 10000) -> float:
+    """Time `func` and print the best per call duration in microseconds."""
+    per_call = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+    print(f"{name:<60} {per_call:10.2f} us")
+    return per_call
@@ -0,0 +1,26 @@
+"""Benchmark encoding and decoding Aqara E1 thermostat schedule settings."""
+
+import asyncio
+
+from tests.benchmarks import report
+from zhaquirks.xiaomi.aqara.thermostat_agl001 import ScheduleSettings
+
+SCHEDULE = "mon,tue,wed,thu,fri|8:00,24.0|18:00,17.0|23:00,22.0|8:00,22.0"
+VALVES = 25
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    payload = bytes(ScheduleSettings(SCHEDULE))
+    report("parse schedule string", lambda: ScheduleSettings(SCHEDULE))
+    report("decode schedule bytes", lambda: ScheduleSettings(payload))
+    report("format schedule string", lambda: str(ScheduleSettings(payload)))
+    report(
+        f"push schedule to {VALVES} valves",
+        lambda: [ScheduleSettings(SCHEDULE).serialize() for _ in range(VALVES)],
+        number=1000,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""Benchmark LocalDataCluster.read_attributes_raw for 1, 10 and 100 attributes."""
+
+import asyncio
+import functools
+
+import zigpy.device
+import zigpy.types
+
+from tests.benchmarks import mock_app, report, run_sync
+from zhaquirks import LocalDataCluster
+
+
+class BenchLocalCluster(LocalDataCluster):
+    """Local cluster with constant, cached and unknown attributes."""
+
+    cluster_id = 0xFC00
+    ep_attribute = "bench_local"
+    _CONSTANT_ATTRIBUTES = {attrid: attrid for attrid in range(10)}
+    _VALID_ATTRIBUTES = set(range(90, 95))
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    device = zigpy.device.Device(
+        mock_app(),
+        zigpy.types.EUI64([1, 2, 3, 4, 5, 6, 7, 8]),
+        zigpy.types.NWK(0x1234),
+    )
+    endpoint = device.add_endpoint(1)
+    cluster = BenchLocalCluster(endpoint)
+    endpoint.add_input_cluster(cluster.cluster_id, cluster)
+    for attrid in range(10, 90):
+        cluster._update_attribute(attrid, attrid)
+
+    for count in (1, 10, 100):
+        # constants first, then cached values, valid and unsupported attributes
+        attributes = [attrid * 100 // count for attrid in range(count)]
+        report(
+            f"read_attributes_raw {count} attributes",
+            functools.partial(run_sync, cluster.read_attributes_raw, attributes),
+            number=1000,
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""Benchmark PhilipsRemoteCluster notification handling for RWL022 and ROM001."""
+
+import asyncio
+import functools
+
+from tests.benchmarks import device_from_quirk, report
+from zhaquirks.philips.rom001 import PhilipsROM001
+from zhaquirks.philips.rwl022 import PhilipsRWL022
+
+# manufacturer specific notification frames: button 1, hold / long release / short release
+HOLD = b"\x1d\x0b\x10\x01\x00\x01\x00\x000\x01!\x08\x00"
+LONG_RELEASE = b"\x1d\x0b\x10\x02\x00\x01\x00\x000\x03!\x10\x00"
+SHORT_RELEASE = b"\x1d\x0b\x10\x03\x00\x01\x00\x000\x02!\x01\x00"
+
+
+def handle_frame(cluster, frame: bytes) -> None:
+    """Deserialize and handle a frame like zigpy does for an incoming packet."""
+    cluster.handle_message(*cluster.deserialize(frame))
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    for quirk in (PhilipsRWL022, PhilipsROM001):
+        device = device_from_quirk(quirk)
+        cluster = device.endpoints[1].philips_remote_cluster
+        name = quirk.__name__
+
+        for frame_name, frame in (
+            ("hold", HOLD),
+            ("long_release", LONG_RELEASE),
+            ("short_release", SHORT_RELEASE),
+        ):
+            hdr, args = cluster.deserialize(frame)
+            report(
+                f"{name} handle_cluster_request {frame_name}",
+                functools.partial(cluster.handle_cluster_request, hdr, args),
+            )
+            report(
+                f"{name} deserialize + handle_message {frame_name}",
+                functools.partial(handle_frame, cluster, frame),
+            )
+
+        hdr, args = cluster.deserialize(SHORT_RELEASE)
+        event_args = {"button": "on", "duration": 1, "args": args}
+        for count in (1, 2):
+            report(
+                f"{name} multi-press events x{count}",
+                functools.partial(cluster._send_press_event, 1, event_args, count),
+            )
+
+        for queue in cluster.button_press_queue.values():
+            queue.cancel()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,42 @@
+"""Benchmark quick initializing 500 Xiaomi devices from their quirk signature."""
+
+import asyncio
+
+import zigpy.device
+import zigpy.types
+
+from tests.benchmarks import mock_app, report
+from zhaquirks.xiaomi.aqara.weather import Weather
+
+DEVICES = 500
+
+
+def quick_init_devices(app, with_quirk: bool = True) -> None:
+    """Create uninitialized devices and quick init them."""
+    for index in range(DEVICES):
+        device = zigpy.device.Device(
+            app,
+            zigpy.types.EUI64(index.to_bytes(8, "little")),
+            zigpy.types.NWK(index),
+        )
+        if with_quirk:
+            Weather.from_signature(device, "lumi.weather")
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    app = mock_app()
+    report(
+        f"create {DEVICES} devices",
+        lambda: quick_init_devices(app, with_quirk=False),
+        number=10,
+    )
+    report(
+        f"create and quick init {DEVICES} devices",
+        lambda: quick_init_devices(app),
+        number=10,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
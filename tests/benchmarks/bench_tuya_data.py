@@ -0,0 +1,60 @@
+"""Benchmark decoding and encoding legacy Tuya data payloads."""
+
+import asyncio
+
+import zigpy.types as t
+
+from tests.benchmarks import device_from_quirk, report
+from tests.test_tuya import (
+    ZCL_TUYA_VALVE_BOOST,
+    ZCL_TUYA_VALVE_OFF,
+    ZCL_TUYA_VALVE_STATE_50,
+    ZCL_TUYA_VALVE_TEMPERATURE,
+    ZCL_TUYA_VALVE_WINDOW_DETECTION,
+    ZCL_TUYA_VALVE_WORKDAY_SCHEDULE,
+)
+from zhaquirks.tuya import Data, TuyaManufCluster
+from zhaquirks.tuya.ts0601_trv import MoesHY368_Type1, data144
+
+FRAMES = (
+    ZCL_TUYA_VALVE_TEMPERATURE,
+    ZCL_TUYA_VALVE_WINDOW_DETECTION,
+    ZCL_TUYA_VALVE_WORKDAY_SCHEDULE,
+    ZCL_TUYA_VALVE_OFF,
+    ZCL_TUYA_VALVE_BOOST,
+    ZCL_TUYA_VALVE_STATE_50,
+)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    payloads = [
+        TuyaManufCluster.Command.deserialize(frame[3:])[0].data for frame in FRAMES
+    ]
+    ints = [payload for payload in payloads if payload[0] <= 4]
+    schedule = payloads[2]
+
+    report(
+        f"deserialize {len(FRAMES)} commands",
+        lambda: [TuyaManufCluster.Command.deserialize(frame[3:]) for frame in FRAMES],
+    )
+    report(
+        f"int from {len(ints)} payloads",
+        lambda: [t.int32s(payload) for payload in ints],
+    )
+    report("data144 from schedule payload", lambda: data144(schedule))
+    report("payload from uint32_t", lambda: Data(t.uint32_t(295)))
+    report("payload from data144", lambda: Data(data144(schedule)))
+
+    device = device_from_quirk(MoesHY368_Type1)
+    tuya_cluster = device.endpoints[1].tuya_manufacturer
+    messages = [tuya_cluster.deserialize(frame) for frame in FRAMES]
+    report(
+        f"handle {len(FRAMES)} valve frames",
+        lambda: [tuya_cluster.handle_message(hdr, args) for hdr, args in messages],
+        number=1000,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
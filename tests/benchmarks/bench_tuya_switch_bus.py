@@ -0,0 +1,122 @@
+"""Benchmark the switch_bus fan-out of a sixteen gang TuyaSwitch."""
+
+import asyncio
+import functools
+
+from zigpy.profiles import zha
+from zigpy.quirks import CustomDevice
+from zigpy.util import ListenableMixin
+from zigpy.zcl.clusters.general import Basic, OnOff
+
+from tests.benchmarks import device_from_quirk, report
+from zhaquirks import Bus
+from zhaquirks.const import (
+    DEVICE_TYPE,
+    ENDPOINTS,
+    INPUT_CLUSTERS,
+    MODELS_INFO,
+    OUTPUT_CLUSTERS,
+    PROFILE_ID,
+)
+from zhaquirks.tuya import (
+    SWITCH_EVENT,
+    TuyaManufacturerClusterOnOff,
+    TuyaOnOff,
+    TuyaSwitch,
+)
+
+GANGS = 16
+
+
+class BenchSwitch(TuyaSwitch):
+    """Sixteen gang switch with a TuyaOnOff cluster per gang."""
+
+    signature = {
+        MODELS_INFO: [("_TZE200_bench", "TS0601")],
+        ENDPOINTS: {
+            ep_id: {
+                PROFILE_ID: zha.PROFILE_ID,
+                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
+                INPUT_CLUSTERS: [Basic.cluster_id, OnOff.cluster_id]
+                + ([TuyaManufacturerClusterOnOff.cluster_id] if ep_id == 1 else []),
+                OUTPUT_CLUSTERS: [],
+            }
+            for ep_id in range(1, GANGS + 1)
+        },
+    }
+
+    replacement = {
+        ENDPOINTS: {
+            ep_id: {
+                PROFILE_ID: zha.PROFILE_ID,
+                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT,
+                INPUT_CLUSTERS: [Basic.cluster_id, TuyaOnOff]
+                + ([TuyaManufacturerClusterOnOff] if ep_id == 1 else []),
+                OUTPUT_CLUSTERS: [],
+            }
+            for ep_id in range(1, GANGS + 1)
+        },
+    }
+
+
+class BroadcastBenchSwitch(BenchSwitch):
+    """Sixteen gang switch delivering every switch event to every gang."""
+
+    def __init__(self, *args, **kwargs):
+        """Init device."""
+        self.switch_bus = Bus()
+        CustomDevice.__init__(self, *args, **kwargs)
+
+
+def send_all(listener_event) -> None:
+    """Report a state for every gang, one event per gang."""
+    for channel in range(1, GANGS + 1):
+        listener_event(SWITCH_EVENT, channel, 1)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    broadcast_bus = device_from_quirk(BroadcastBenchSwitch).switch_bus
+    switch_bus = device_from_quirk(BenchSwitch).switch_bus
+
+    report(
+        f"ListenableMixin.listener_event ({GANGS} gangs)",
+        functools.partial(
+            ListenableMixin.listener_event, broadcast_bus, SWITCH_EVENT, 3, 1
+        ),
+    )
+    report(
+        f"Bus.listener_event ({GANGS} gangs)",
+        functools.partial(broadcast_bus.listener_event, SWITCH_EVENT, 3, 1),
+    )
+    report(
+        f"TuyaSwitchBus.listener_event ({GANGS} gangs)",
+        functools.partial(switch_bus.listener_event, SWITCH_EVENT, 3, 1),
+    )
+    report(
+        f"TuyaSwitchBus.emitter ({GANGS} gangs)",
+        functools.partial(switch_bus.emitter(SWITCH_EVENT), 3, 1),
+    )
+    report(
+        f"Bus.listener_event all channels ({GANGS} gangs)",
+        functools.partial(send_all, broadcast_bus.listener_event),
+        number=1000,
+    )
+    report(
+        f"TuyaSwitchBus.listener_event all channels ({GANGS} gangs)",
+        functools.partial(send_all, switch_bus.listener_event),
+        number=1000,
+    )
+    # dispatch overhead only, no listener handles this event
+    report(
+        f"unhandled ListenableMixin.listener_event ({GANGS} gangs)",
+        functools.partial(ListenableMixin.listener_event, broadcast_bus, "unhandled"),
+    )
+    report(
+        f"unhandled Bus.listener_event ({GANGS} gangs)",
+        functools.partial(broadcast_bus.listener_event, "unhandled"),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
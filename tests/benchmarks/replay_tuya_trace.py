@@ -0,0 +1,108 @@
+"""Replay a captured Tuya frame trace through its quirks on a mock application.
+
+Capture a trace with `zhaquirks.tuya.capture`, then run e.g.
+``python -m tests.benchmarks.replay_tuya_trace tuya.trace --repeat 10``
+to report the decode throughput and the latency per datapoint. The latency of a
+frame carrying several datapoints is split evenly between them.
+"""
+
+import argparse
+import asyncio
+from collections import defaultdict
+import importlib
+import time
+
+from tests.benchmarks import device_from_quirk, mock_app
+from zhaquirks.tuya import TuyaCommand, TuyaManufCluster
+from zhaquirks.tuya.capture import TraceDevice, read_trace
+
+
+def load_quirk(device: TraceDevice):
+    """Import the quirk class of a trace device."""
+    module_name, _, qualname = device.quirk.rpartition(".")
+    try:
+        return getattr(importlib.import_module(module_name), qualname)
+    except (ImportError, AttributeError):
+        return None
+
+
+def datapoints(args) -> list[int]:
+    """Return the datapoint ids carried by a deserialized Tuya command."""
+    if args and isinstance(args[0], TuyaCommand):
+        return [datapoint.dp for datapoint in args[0].datapoints]
+    if args and isinstance(args[0], TuyaManufCluster.Command):
+        return [args[0].command_id & 0xFF]
+    return []
+
+
+async def main() -> None:
+    """Run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", help="trace captured by zhaquirks.tuya.capture")
+    parser.add_argument("--repeat", type=int, default=1, help="replays of the trace")
+    options = parser.parse_args()
+
+    frames = list(read_trace(options.trace))
+    app = mock_app()
+    clusters = {}
+    for frame in frames:
+        key = (frame.device, frame.endpoint_id, frame.cluster_id)
+        if key in clusters:
+            continue
+        quirk = load_quirk(frame.device)
+        if quirk is None:
+            print(f"skipping {frame.device.ieee}, unknown quirk {frame.device.quirk}")
+            clusters[key] = None
+            continue
+        device = app.devices.get(frame.device.ieee) or device_from_quirk(
+            quirk, app, ieee=frame.device.ieee
+        )
+        endpoint = device.endpoints.get(frame.endpoint_id)
+        clusters[key] = endpoint and (
+            endpoint.in_clusters.get(frame.cluster_id)
+            or endpoint.out_clusters.get(frame.cluster_id)
+        )
+
+    # (quirk, dp) -> [count, total ns, max ns]
+    latencies = defaultdict(lambda: [0, 0, 0])
+    replayed = values = total_ns = 0
+    for _ in range(options.repeat):
+        for frame in frames:
+            cluster = clusters[frame.device, frame.endpoint_id, frame.cluster_id]
+            if cluster is None:
+                continue
+            start = time.perf_counter_ns()
+            hdr, args = cluster.deserialize(frame.data)
+            cluster.handle_message(hdr, args)
+            elapsed = time.perf_counter_ns() - start
+            replayed += 1
+            total_ns += elapsed
+
+            dps = datapoints(args)
+            values += len(dps)
+            for dp in dps:
+                stats = latencies[frame.device.quirk.rpartition(".")[2], dp]
+                stats[0] += 1
+                stats[1] += elapsed // len(dps)
+                stats[2] = max(stats[2], elapsed // len(dps))
+        # let default responses and other scheduled tasks run
+        await asyncio.sleep(0)
+
+    if not replayed:
+        print("no frames replayed")
+        return
+    seconds = total_ns / 1e9
+    print(
+        f"replayed {replayed} frames with {values} datapoints in {seconds:.3f} s: "
+        f"{replayed / seconds:.0f} frames/s, {values / seconds:.0f} datapoints/s"
+    )
+    print(f"{'quirk':<40} {'dp':>4} {'count':>8} {'mean us':>10} {'max us':>10}")
+    for (quirk, dp), (count, dp_ns, max_ns) in sorted(latencies.items()):
+        print(
+            f"{quirk:<40} {dp:>4} {count:>8} "
+            f"{dp_ns / count / 1000:>10.2f} {max_ns / 1000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
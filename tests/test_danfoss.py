@@ -1,7 +1,9 @@
 """Tests the Danfoss quirk (all tests were written for the Popp eT093WRO)."""
 
+import asyncio
 from unittest import mock
 
+import pytest
 from zigpy.quirks import CustomCluster
 import zigpy.types as t
 from zigpy.zcl import foundation
@@ -9,6 +11,7 @@ from zigpy.zcl.clusters.hvac import Thermostat
 from zigpy.zcl.foundation import WriteAttributesStatusRecord, ZCLAttributeDef
 
 import zhaquirks
+from zhaquirks import time_sync
 from zhaquirks.danfoss.thermostat import CustomizedStandardCluster
 
 zhaquirks.setup()
@@ -74,6 +77,61 @@ async def test_danfoss_time_bind(zigpy_device_from_quirk):
         assert 0x0002 in danfoss_time_cluster._attr_cache
 
 
+async def test_danfoss_time_periodic_sync(zigpy_device_from_quirk):
+    """Test the time being written periodically, staggered between devices."""
+    service = time_sync.TimeSync(interval_s=600)
+    loop = asyncio.get_running_loop()
+    clock = loop.time()
+
+    async def run_until(when):
+        nonlocal clock
+        clock = when
+        service._run_due()
+        await asyncio.gather(*list(service._tasks))
+
+    def mock_write(attributes, manufacturer=None):
+        records = [
+            WriteAttributesStatusRecord(foundation.Status.SUCCESS) for _ in attributes
+        ]
+        return [records, []]
+
+    with (
+        mock.patch.object(time_sync, "service", service),
+        mock.patch.object(service, "now", return_value=(946684800 + 10, 946684800)),
+        mock.patch.object(loop, "time", side_effect=lambda: clock),
+        mock.patch(
+            "zigpy.zcl.Cluster._write_attributes",
+            mock.AsyncMock(side_effect=mock_write),
+        ) as write_mock,
+    ):
+        devices = [
+            zigpy_device_from_quirk(
+                zhaquirks.danfoss.thermostat.DanfossThermostat,
+                ieee=t.EUI64([1, 2, 3, 4, 5, 6, 7, ieee]),
+            )
+            for ieee in range(2)
+        ]
+        due = sorted(due for due, _ in service._writes.values())
+        assert len(due) == 2 and clock <= due[0] < due[1] < clock + 600
+
+        await run_until(due[0])
+        assert write_mock.call_count == 1
+        await run_until(due[1])
+        assert write_mock.call_count == 2
+        time_cluster = devices[0].endpoints[1].time
+        assert time_cluster.get("time") == 10
+        assert time_cluster.get("time_zone") == -10
+
+        await run_until(due[1] + 600)
+        assert write_mock.call_count == 4
+
+        for device in devices:
+            service.cancel(device.ieee)
+        await run_until(due[1] + 1200)
+        assert write_mock.call_count == 4
+        service.cancel_all()
+
+
 async def test_danfoss_thermostat_write_attributes(zigpy_device_from_quirk):
     """Test the Thermostat writes behaving correctly, in particular regarding setpoint."""
     device = zigpy_device_from_quirk(zhaquirks.danfoss.thermostat.DanfossThermostat)
@@ -237,3 +295,56 @@ async def test_customized_standardcluster(zigpy_device_from_quirk):
         assert result
         assert fail
         assert reports == [656]
+
+
+@pytest.mark.parametrize("concurrent", (True, False))
+async def test_customized_standardcluster_split_requests(
+    zigpy_device_from_quirk, concurrent
+):
+    """Test split requests are sent concurrently or sequentially and merged."""
+    device = zigpy_device_from_quirk(zhaquirks.danfoss.thermostat.DanfossThermostat)
+
+    danfoss_thermostat_cluster = device.endpoints[1].in_clusters[Thermostat.cluster_id]
+    danfoss_thermostat_cluster.concurrent_split_requests = concurrent
+    danfoss_thermostat_cluster.attributes = {
+        656: ZCLAttributeDef(type=t.uint8_t, is_manufacturer_specific=True),
+        56454: ZCLAttributeDef(type=t.uint8_t, is_manufacturer_specific=False),
+        56455: ZCLAttributeDef(type=t.uint8_t, is_manufacturer_specific=False),
+    }
+
+    in_flight = 0
+    max_in_flight = 0
+    requests = []
+
+    async def mock_read_attributes(attrs, *args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        requests.append(attrs)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return [[attr * 2 for attr in attrs]]
+
+    patch_read_attributes = mock.patch.object(
+        CustomCluster,
+        "_read_attributes",
+        mock.AsyncMock(side_effect=mock_read_attributes),
+    )
+
+    with patch_read_attributes as read_mock:
+        result = await danfoss_thermostat_cluster._read_attributes([56454, 656, 56455])
+        assert result == [[656 * 2, 56454 * 2, 56455 * 2]]
+        assert requests == [[656], [56454, 56455]]
+        assert max_in_flight == (2 if concurrent else 1)
+
+        # a single request is sent when all attributes are of the same kind
+        read_mock.reset_mock()
+        requests.clear()
+        result = await danfoss_thermostat_cluster._read_attributes([56454, 56455])
+        assert result == [[56454 * 2, 56455 * 2]]
+        assert requests == [[56454, 56455]]
+
+        # nothing is sent without attributes
+        read_mock.reset_mock()
+        assert await danfoss_thermostat_cluster._read_attributes([]) == [[]]
+        assert read_mock.call_count == 0
@@ -250,3 +250,57 @@ async def test_double_power_config_firmware(
         # check log output if we expect a warning
         if expect_log_warning:
             assert f"sw_build_id is not a number: {firmware} for device" in caplog.text
+
+
+async def test_double_power_config_firmware_read_backoff(zigpy_device_from_quirk):
+    """Test sw_build_id is read once at a time and retried with a backoff."""
+
+    device = zigpy_device_from_quirk(zhaquirks.ikea.fivebtnremote.IkeaTradfriRemote1)
+
+    basic_cluster = device.endpoints[1].basic
+    power_cluster = device.endpoints[1].power
+    battery_pct_id = PowerConfiguration.AttributeDefs.battery_percentage_remaining.id
+
+    # sleepy device that doesn't return the sw_build_id
+    def mock_read(attributes, manufacturer=None):
+        records = [
+            foundation.ReadAttributeRecord(
+                attr, foundation.Status.UNSUPPORTED_ATTRIBUTE, foundation.TypeValue()
+            )
+            for attr in attributes
+        ]
+        return (records,)
+
+    p1 = mock.patch.object(power_cluster, "create_catching_task")
+    p2 = mock.patch.object(
+        basic_cluster, "_read_attributes", mock.AsyncMock(side_effect=mock_read)
+    )
+    p3 = mock.patch("zhaquirks.ikea.time.monotonic", return_value=1000.0)
+
+    with p1 as mock_task, p2 as request_mock, p3 as monotonic_mock:
+        # reports while a read is in flight don't start another one
+        power_cluster.update_attribute(battery_pct_id, 50)
+        power_cluster.update_attribute(battery_pct_id, 50)
+        assert mock_task.call_count == 1
+
+        await mock_task.call_args[0][0]
+        assert request_mock.call_count == 1
+
+        # failed read backs off
+        power_cluster.update_attribute(battery_pct_id, 50)
+        assert mock_task.call_count == 1
+
+        monotonic_mock.return_value += power_cluster.FW_READ_BACKOFF_MIN_S
+        power_cluster.update_attribute(battery_pct_id, 50)
+        assert mock_task.call_count == 2
+        await mock_task.call_args[0][0]
+
+        # the backoff doubles after another failed read
+        monotonic_mock.return_value += power_cluster.FW_READ_BACKOFF_MIN_S
+        power_cluster.update_attribute(battery_pct_id, 50)
+        assert mock_task.call_count == 2
+
+        monotonic_mock.return_value += power_cluster.FW_READ_BACKOFF_MIN_S
+        power_cluster.update_attribute(battery_pct_id, 50)
+        assert mock_task.call_count == 3
+        mock_task.call_args[0][0].close()
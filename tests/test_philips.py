@@ -1,5 +1,6 @@
 """Tests for Philips quirks."""
 
+import asyncio
 from unittest import mock
 
 import pytest
@@ -631,19 +632,17 @@ def test_PhilipsRemoteCluster_long_press(
 async def test_ButtonPressQueue_presses_without_pause(button_presses):
     """Test ButtonPressQueue presses without pause in between presses."""
 
-    q = ButtonPressQueue()
-    q._ms_threshold = 50
+    q = ButtonPressQueue(0.05)
     cb = mock.MagicMock()
     for _ in range(button_presses):
         q.press(cb)
 
-    # await cluster.button_press_queue._task
-    # Instead of awaiting the job, significantly extending the time
-    # these tests need, we just abort it and call the callback
+    # Instead of waiting for the timer, significantly extending the time
+    # these tests need, we just cancel it and call the callback
     # ourselves.
-    assert q._task is not None
-    q._task.cancel()
-    q._ms_last_click = 0
+    assert q._timer_handle is not None
+    q.cancel()
+    assert q._timer_handle is None
     q._callback(q._click_counter)
     cb.assert_called_once_with(button_presses)
 
@@ -658,14 +657,15 @@ async def test_ButtonPressQueue_presses_without_pause(button_presses):
 async def test_ButtonPressQueue_presses_with_pause(press_sequence):
     """Test ButtonPressQueue with pauses in between button press sequences."""
 
-    q = ButtonPressQueue()
-    q._ms_threshold = 50
+    q = ButtonPressQueue(0.05)
     cb = mock.MagicMock()
 
     for seq in press_sequence:
         for _ in range(seq):
             q.press(cb)
-        await q._task
+        assert cb.call_count < len(press_sequence)
+        await asyncio.sleep(0.1)
+        assert q._timer_handle is None
 
     assert cb.call_count == len(press_sequence)
 
@@ -676,6 +676,24 @@ async def test_ButtonPressQueue_presses_with_pause(press_sequence):
     cb.assert_has_calls(calls)
 
 
+async def test_ButtonPressQueue_press_extends_window():
+    """Test a press within the window extends the multi-press sequence."""
+
+    q = ButtonPressQueue(0.05)
+    cb = mock.MagicMock()
+
+    q.press(cb)
+    handle = q._timer_handle
+    await asyncio.sleep(0.03)
+    q.press(cb)
+    assert q._timer_handle is handle
+    await asyncio.sleep(0.03)
+    cb.assert_not_called()
+
+    await asyncio.sleep(0.05)
+    cb.assert_called_once_with(2)
+
+
 def test_rdm002_triggers():
     """Ensure RDM002 triggers won't break."""
 
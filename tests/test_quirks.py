@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import collections
 import importlib
 import json
@@ -21,7 +22,7 @@ from zigpy.zcl import foundation
 import zigpy.zdo.types
 
 import zhaquirks
-from zhaquirks import const
+from zhaquirks import const, message_rates, profiling
 import zhaquirks.bosch.motion
 import zhaquirks.centralite.cl_3310S
 from zhaquirks.const import (
@@ -54,6 +55,7 @@ from zhaquirks.const import (
 )
 import zhaquirks.konke
 import zhaquirks.philips
+import zhaquirks.tuya.ts0601_din_power
 from zhaquirks.xiaomi import XIAOMI_NODE_DESC
 import zhaquirks.xiaomi.aqara.vibration_aq1
 
@@ -284,6 +286,40 @@ def test_dev_from_signature(
         assert ep.device_type == ep_data[DEVICE_TYPE]
         assert list(ep.in_clusters) == ep_data[INPUT_CLUSTERS]
         assert list(ep.out_clusters) == ep_data[OUTPUT_CLUSTERS]
+        if 0x0000 in ep.in_clusters:
+            assert ep.basic.get("manufacturer") == device.manufacturer
+            assert ep.basic.get("model") == device.model
+
+    # the endpoint template is compiled once per quirk
+    assert QuirkDevice._signature_template() is QuirkDevice._signature_template()
+
+
+def test_dev_from_signature_edited_in_place(raw_device: zigpy.device.Device) -> None:
+    """Test in place edits of a quirk signature are used by quick init."""
+
+    class QuirkDevice(zhaquirks.QuickInitDevice):
+        signature = {
+            ENDPOINTS: {
+                1: {
+                    PROFILE_ID: 260,
+                    DEVICE_TYPE: 0x0100,
+                    INPUT_CLUSTERS: [0x0000],
+                    OUTPUT_CLUSTERS: [0x0019],
+                },
+            },
+            MANUFACTURER: "manufacturer",
+            MODEL: "model",
+            NODE_DESCRIPTOR: XIAOMI_NODE_DESC,
+        }
+
+    QuirkDevice.from_signature(raw_device)
+    ep_signature = QuirkDevice.signature[ENDPOINTS][1]
+    ep_signature[DEVICE_TYPE] = 0x0103
+    ep_signature[INPUT_CLUSTERS].append(0x0006)
+
+    endpoint = QuirkDevice.from_signature(raw_device).endpoints[1]
+    assert endpoint.device_type == 0x0103
+    assert list(endpoint.in_clusters) == [0x0000, 0x0006]
 
 
 @pytest.mark.parametrize(
@@ -873,3 +909,308 @@ async def test_local_data_cluster(device_mock) -> None:
         {2: None},
         {},
     )
+
+
+async def test_reset_timer_wheel() -> None:
+    """Ensure the reset timer wheel runs, postpones and cancels callbacks."""
+    loop = asyncio.get_running_loop()
+    wheel = zhaquirks.ResetTimerWheel(loop, granularity=0.02)
+    calls = []
+
+    wheel.schedule("a", 0.01, lambda: calls.append("a"))
+    wheel.schedule("b", 0.03, lambda: calls.append("b"))
+    wheel.schedule("c", 0.01, lambda: calls.append("c"))
+
+    # postpone "a" into a later slot, bring "b" forward and cancel "c"
+    wheel.schedule("a", 0.05, lambda: calls.append("a"))
+    wheel.schedule("b", 0.0, lambda: calls.append("b"))
+    assert wheel.cancel("c")
+    assert not wheel.cancel("c")
+
+    await asyncio.sleep(0.02)
+    assert calls == ["b"]
+
+    await asyncio.sleep(0.06)
+    assert calls == ["b", "a"]
+    assert not wheel.cancel("a")
+    assert wheel._timer_handle is None
+
+    # the running loop shares a single wheel
+    assert zhaquirks.reset_timer_wheel() is zhaquirks.reset_timer_wheel()
+
+
+async def test_local_data_cluster_constant_records(device_mock) -> None:
+    """Ensure read records follow constant overrides and are never shared."""
+    registry = DeviceRegistry()
+
+    class TestLocalCluster(zhaquirks.LocalDataCluster):
+        """Test cluster."""
+
+        cluster_id = 0x1234
+        _CONSTANT_ATTRIBUTES = {1: 10}
+
+    (
+        QuirkBuilder(device_mock.manufacturer, device_mock.model, registry=registry)
+        .adds(TestLocalCluster)
+        .add_to_registry()
+    )
+    device = registry.get_device(device_mock)
+    cluster = device.endpoints[1].in_clusters[0x1234]
+    cluster._update_attribute(3, 30)
+
+    (records,) = await cluster.read_attributes_raw([1, 3, 4])
+    assert [(r.attrid, r.status, r.value.value) for r in records] == [
+        (1, foundation.Status.SUCCESS, 10),
+        (3, foundation.Status.SUCCESS, 30),
+        (4, foundation.Status.UNSUPPORTED_ATTRIBUTE, None),
+    ]
+
+    # every read gets its own records, modifying them doesn't affect later reads
+    records[0].attrid = 5
+    records[0].value.value = 50
+    (records_again,) = await cluster.read_attributes_raw([1])
+    assert (records_again[0].attrid, records_again[0].value.value) == (1, 10)
+
+    # per instance and in place changes of the constants are respected
+    cluster._CONSTANT_ATTRIBUTES = {1: 11, 2: 22}
+    assert await cluster.read_attributes([1, 2]) == ({1: 11, 2: 22}, {})
+    cluster._CONSTANT_ATTRIBUTES[1] = 12
+    assert await cluster.read_attributes([1]) == ({1: 12}, {})
+    assert TestLocalCluster._CONSTANT_ATTRIBUTES == {1: 10}
+
+
+async def test_local_data_cluster_write_attributes(device_mock) -> None:
+    """Ensure written attributes are updated through _update_attribute."""
+    registry = DeviceRegistry()
+
+    class TestLocalCluster(zhaquirks.LocalDataCluster):
+        """Test cluster."""
+
+        cluster_id = 0x1234
+        attributes = {
+            1: zcl.foundation.ZCLAttributeDef("first", zigpy.types.uint8_t),
+            2: zcl.foundation.ZCLAttributeDef("second", zigpy.types.uint8_t),
+        }
+
+    (
+        QuirkBuilder(device_mock.manufacturer, device_mock.model, registry=registry)
+        .adds(TestLocalCluster)
+        .add_to_registry()
+    )
+    device = registry.get_device(device_mock)
+    cluster = device.endpoints[1].in_clusters[0x1234]
+
+    listener = mock.MagicMock(spec=["attribute_updated"])
+    cluster.add_listener(listener)
+
+    await cluster.write_attributes({"first": 10, 2: 20, 3: 30})
+
+    assert cluster._attr_cache == {1: 10, 2: 20}
+    assert [call.args[:2] for call in listener.attribute_updated.call_args_list] == [
+        (1, 10),
+        (2, 20),
+    ]
+
+    with mock.patch.object(
+        TestLocalCluster, "_update_attribute", autospec=True
+    ) as update_mock:
+        await cluster.write_attributes({1: 11, 2: 21})
+    assert update_mock.call_args_list == [
+        mock.call(cluster, 1, 11),
+        mock.call(cluster, 2, 21),
+    ]
+
+
+async def test_eventable_cluster_event_policies(device_mock) -> None:
+    """Ensure attribute event policies rate limit ZHA events."""
+    registry = DeviceRegistry()
+
+    class TestEventableCluster(zhaquirks.EventableCluster, zhaquirks.LocalDataCluster):
+        """Test cluster."""
+
+        cluster_id = 0x1234
+        attributes = {
+            1: zcl.foundation.ZCLAttributeDef("changes", zigpy.types.uint8_t),
+            2: zcl.foundation.ZCLAttributeDef("throttled", zigpy.types.uint8_t),
+            3: zcl.foundation.ZCLAttributeDef("latest", zigpy.types.uint8_t),
+            4: zcl.foundation.ZCLAttributeDef("all", zigpy.types.uint8_t),
+        }
+        event_policies = {
+            1: zhaquirks.EventPolicy(on_change=True),
+            2: zhaquirks.EventPolicy(min_interval_ms=1000),
+            3: zhaquirks.EventPolicy(min_interval_ms=50, last_value_only=True),
+        }
+
+    (
+        QuirkBuilder(device_mock.manufacturer, device_mock.model, registry=registry)
+        .adds(TestEventableCluster)
+        .add_to_registry()
+    )
+    device = registry.get_device(device_mock)
+    cluster = device.endpoints[1].in_clusters[0x1234]
+    listener = mock.MagicMock(spec=["zha_send_event"])
+    cluster.add_listener(listener)
+
+    def events():
+        sent = [
+            (c[0][1][const.ATTRIBUTE_NAME], c[0][1][const.VALUE])
+            for c in listener.zha_send_event.call_args_list
+        ]
+        listener.zha_send_event.reset_mock()
+        return sent
+
+    for value in (1, 1, 2, 2, 1):
+        cluster._update_attribute(1, value)
+        cluster._update_attribute(2, value)
+        cluster._update_attribute(4, value)
+    assert events() == [
+        ("changes", 1),
+        ("throttled", 1),
+        ("all", 1),
+        ("all", 1),
+        ("changes", 2),
+        ("all", 2),
+        ("all", 2),
+        ("changes", 1),
+        ("all", 1),
+    ]
+
+    for value in (1, 2, 3):
+        cluster._update_attribute(3, value)
+    assert events() == [("latest", 1)]
+    await asyncio.sleep(0.1)
+    assert events() == [("latest", 3)]
+    # all attribute values are still cached
+    assert cluster._attr_cache == {1: 1, 2: 1, 3: 3, 4: 1}
+
+
+def test_bus_cached_handlers() -> None:
+    """Ensure the bus caches listener methods until listeners change."""
+    bus = zhaquirks.Bus()
+    first = mock.MagicMock(spec=["switch_event"])
+    second = mock.MagicMock(spec=["switch_event", "other_event"])
+    second.switch_event.side_effect = RuntimeError
+    context = mock.MagicMock(spec=["switch_event"])
+
+    bus.add_listener(first)
+    emit = bus.emitter("switch_event")
+    assert bus.listener_event("switch_event", 1, 0) == [first.switch_event.return_value]
+    assert bus.listener_event("other_event") == []
+
+    bus.add_listener(second)
+    bus.add_context_listener(context)
+    emit(2, 1)
+    first.switch_event.assert_called_with(2, 1)
+    second.switch_event.assert_called_once_with(2, 1)
+    context.switch_event.assert_called_once_with(bus, 2, 1)
+    assert bus.listener_event("other_event") == [second.other_event.return_value]
+
+    bus.remove_listener(first)
+    bus.remove_listener(second)
+    assert bus.handlers("other_event") == ()
+    assert len(bus.listener_event("switch_event", 3, 0)) == 1
+    emit(4, 1)
+    assert first.switch_event.call_count == 2
+    assert second.switch_event.call_count == 1
+    context.switch_event.assert_called_with(bus, 4, 1)
+
+
+def test_profiling(zigpy_device_from_quirk, monkeypatch) -> None:
+    """Test profiling hooks record per quirk and cluster statistics."""
+    manuf_type = zhaquirks.tuya.ts0601_din_power.TuyaManufClusterDinPower
+    original = manuf_type._update_attribute
+    device = zigpy_device_from_quirk(zhaquirks.tuya.ts0601_din_power.TuyaPowerMeter)
+    manuf_cluster = device.endpoints[1].in_clusters[manuf_type.cluster_id]
+
+    monkeypatch.delenv(profiling.ENV_VAR, raising=False)
+    profiling.enable_from_env()
+    assert not profiling.is_enabled()
+
+    monkeypatch.setenv(profiling.ENV_VAR, "1")
+    profiling.enable_from_env()
+    try:
+        assert profiling.is_enabled()
+        assert manuf_type._update_attribute is not original
+        profiling.reset()
+
+        manuf_cluster._update_attribute(0x0212, 100)
+        manuf_cluster._update_attribute(0x0212, 101)
+    finally:
+        profiling.disable()
+
+    assert manuf_type._update_attribute is original
+    manuf_cluster._update_attribute(0x0212, 102)
+
+    quirk_stats = profiling.snapshot()["zhaquirks.tuya.ts0601_din_power.TuyaPowerMeter"]
+    stats = quirk_stats["zhaquirks.tuya.ts0601_din_power.TuyaManufClusterDinPower"][
+        "_update_attribute"
+    ]
+    # calls through super() aren't counted twice
+    assert stats["count"] == 2
+    assert sum(stats["histogram"].values()) == 2
+    assert 0 < stats["max_us"] <= stats["total_us"]
+    profiling.reset()
+    assert profiling.snapshot() == {}
+
+
+async def test_profiling_overlapping_calls(zigpy_device_from_quirk) -> None:
+    """Test overlapping coroutine calls and zhaquirks package clusters are timed."""
+    manuf_type = zhaquirks.tuya.ts0601_din_power.TuyaManufClusterDinPower
+    device = zigpy_device_from_quirk(zhaquirks.tuya.ts0601_din_power.TuyaPowerMeter)
+    manuf_cluster = device.endpoints[1].in_clusters[manuf_type.cluster_id]
+    sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def request(*args, **kwargs):
+        sent.set()
+        await release.wait()
+
+    profiling.enable()
+    try:
+        assert (zhaquirks.LocalDataCluster, "write_attributes") in profiling._originals
+        profiling.reset()
+        with mock.patch.object(manuf_cluster.endpoint, "request", request):
+            first = asyncio.create_task(manuf_cluster.write_attributes({0x0212: 1}))
+            await sent.wait()
+            second = asyncio.create_task(manuf_cluster.write_attributes({0x0212: 2}))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+    finally:
+        profiling.disable()
+
+    stats = profiling.snapshot()["zhaquirks.tuya.ts0601_din_power.TuyaPowerMeter"][
+        "zhaquirks.tuya.ts0601_din_power.TuyaManufClusterDinPower"
+    ]["write_attributes"]
+    # the second call started while the first one was still being timed
+    assert stats["count"] == 2
+    profiling.reset()
+
+
+def test_message_rates_window() -> None:
+    """Test message rates are counted over a sliding window."""
+    rates = message_rates.MessageRates(window_s=60)
+    chatty = zigpy.types.EUI64.convert("11:22:33:44:55:66:77:88")
+    quiet = zigpy.types.EUI64.convert("88:77:66:55:44:33:22:11")
+
+    with mock.patch("zhaquirks.message_rates.time.monotonic", return_value=100.5):
+        rates.record(chatty, message_rates.FRAMES)
+        rates.record(chatty, message_rates.VALUES, 3)
+        rates.record(quiet, message_rates.FRAMES)
+    with mock.patch("zhaquirks.message_rates.time.monotonic", return_value=130.0):
+        rates.record(chatty, message_rates.FRAMES, 2)
+        assert rates.totals(chatty) == {
+            message_rates.FRAMES: 3,
+            message_rates.VALUES: 3,
+            message_rates.UPDATES: 0,
+            message_rates.EVENTS: 0,
+        }
+        assert rates.top_devices(1) == [(chatty, 3)]
+    # a whole window later the bucket of second 100 is reused
+    with mock.patch("zhaquirks.message_rates.time.monotonic", return_value=160.0):
+        rates.record(quiet, message_rates.EVENTS)
+        assert rates.top_devices() == [(chatty, 2), (quiet, 0)]
+        assert rates.top_devices(kind=message_rates.EVENTS)[0] == (quiet, 1)
+    with mock.patch("zhaquirks.message_rates.time.monotonic", return_value=1000.0):
+        assert rates.snapshot() == {}
+        assert rates.top_devices() == []
@@ -1,12 +1,13 @@
 """Tests for Tuya quirks."""
 
+import asyncio
 import base64
-import datetime
 import struct
 from unittest import mock
 
 import pytest
 from zigpy.device import Device
+import zigpy.exceptions
 from zigpy.profiles import zha
 from zigpy.quirks import CustomDevice, get_device
 import zigpy.types as t
@@ -14,8 +15,9 @@ from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import PowerConfiguration
 from zigpy.zcl.clusters.security import IasZone, ZoneStatus
 
-from tests.common import ClusterListener, MockDatetime, wait_for_zigpy_tasks
+from tests.common import ClusterListener, wait_for_zigpy_tasks
 import zhaquirks
+from zhaquirks import time_sync
 from zhaquirks.const import (
     DEVICE_TYPE,
     ENDPOINTS,
@@ -26,7 +28,12 @@ from zhaquirks.const import (
     OUTPUT_CLUSTERS,
     PROFILE_ID,
 )
-from zhaquirks.tuya import Data, TuyaManufClusterAttributes, TuyaNewManufCluster
+from zhaquirks.tuya import (
+    Data,
+    TuyaManufClusterAttributes,
+    TuyaNewManufCluster,
+    capture,
+)
 import zhaquirks.tuya.sm0202_motion
 import zhaquirks.tuya.ts0021
 import zhaquirks.tuya.ts0041
@@ -34,6 +41,7 @@ import zhaquirks.tuya.ts0042
 import zhaquirks.tuya.ts0043
 import zhaquirks.tuya.ts011f_plug
 import zhaquirks.tuya.ts0501_fan_switch
+import zhaquirks.tuya.ts0601_din_power
 import zhaquirks.tuya.ts0601_electric_heating
 import zhaquirks.tuya.ts0601_motion
 import zhaquirks.tuya.ts0601_trv
@@ -332,6 +340,9 @@ async def test_tuya_data_conversion():
     assert Data(t.uint32_t(295)) == [4, 0, 0, 1, 39]
     assert Data(t.uint32_t(220)) == [4, 0, 0, 0, 220]
     assert Data(t.int32s(-20)) == [4, 255, 255, 255, 236]
+    assert Data(t.uint32_t(295)).serialize() == b"\x04\x00\x00\x01\x27"
+    assert Data.deserialize(b"\x01\x02") == ([1, 2], b"")
+    assert list(Data([3, 1, 2, 3])) == [3, 2, 1]
 
 
 class TuyaTestManufCluster(TuyaManufClusterAttributes):
@@ -1307,24 +1318,116 @@ async def test_moes(zigpy_device_from_quirk, quirk):
         _, status = await onoff_cluster.command(0x0009)
         assert status == foundation.Status.UNSUP_CLUSTER_COMMAND
 
-        origdatetime = datetime.datetime
-        datetime.datetime = MockDatetime
+        # 02:00 UTC and 01:00 local time
+        with mock.patch.object(time_sync.service, "now", return_value=(7200, 3600)):
+            hdr, args = tuya_cluster.deserialize(ZCL_TUYA_SET_TIME_REQUEST)
+            tuya_cluster.handle_message(hdr, args)
+            await wait_for_zigpy_tasks()
+            m1.assert_called_with(
+                cluster=0xEF00,
+                sequence=1,
+                data=b"\x01\x01\x24\x00\x08\x00\x00\x1c\x20\x00\x00\x0e\x10",
+                command_id=0x24,
+                timeout=5,
+                expect_reply=False,
+                use_ieee=False,
+                ask_for_ack=None,
+                priority=t.PacketPriority.NORMAL,
+            )
 
-        hdr, args = tuya_cluster.deserialize(ZCL_TUYA_SET_TIME_REQUEST)
-        tuya_cluster.handle_message(hdr, args)
-        await wait_for_zigpy_tasks()
-        m1.assert_called_with(
-            cluster=0xEF00,
-            sequence=1,
-            data=b"\x01\x01\x24\x00\x08\x00\x00\x1c\x20\x00\x00\x0e\x10",
-            command_id=0x24,
-            timeout=5,
-            expect_reply=False,
-            use_ieee=False,
-            ask_for_ack=None,
-            priority=t.PacketPriority.NORMAL,
+
+async def test_moes_schedule_diff(zigpy_device_from_quirk):
+    """Test thermostatic valve schedules only update and send changed slots."""
+
+    valve_dev = zigpy_device_from_quirk(zhaquirks.tuya.ts0601_trv.MoesHY368_Type1)
+    tuya_cluster = valve_dev.endpoints[1].tuya_manufacturer
+    thermostat_cluster = valve_dev.endpoints[1].thermostat
+    thermostat_listener = ClusterListener(thermostat_cluster)
+
+    hdr, args = tuya_cluster.deserialize(ZCL_TUYA_VALVE_WORKDAY_SCHEDULE)
+    tuya_cluster.handle_message(hdr, args)
+    assert len(thermostat_listener.attribute_updates) == 18
+
+    # the same schedule with the first period at 6:45 and the top hour flag set
+    hdr, args = tuya_cluster.deserialize(ZCL_TUYA_VALVE_WORKDAY_SCHEDULE)
+    tuya_cluster.handle_message(hdr, args)
+    hdr, args = tuya_cluster.deserialize(
+        ZCL_TUYA_VALVE_WORKDAY_SCHEDULE[:9]
+        + b"\x86\x2d"
+        + ZCL_TUYA_VALVE_WORKDAY_SCHEDULE[11:]
+    )
+    tuya_cluster.handle_message(hdr, args)
+    assert thermostat_listener.attribute_updates[18:] == [(0x4111, 45)]
+    assert thermostat_cluster.get("workday_schedule_1_hour") == 6
+
+    async def async_success(*args, **kwargs):
+        return foundation.Status.SUCCESS
+
+    with mock.patch.object(
+        tuya_cluster.endpoint, "request", side_effect=async_success
+    ) as m1:
+        (status,) = await thermostat_cluster.write_attributes(
+            {
+                "workday_schedule_1_temperature": 1700,
+                "workday_schedule_6_hour": 21,
+            }
+        )
+        assert m1.call_count == 1
+        assert m1.call_args.kwargs["data"] == (
+            b"\x01\x01\x00\x00\x01\x70\x00\x00\x12\x06\x2d\x11\x08\x00\x0f"
+            b"\x0b\x1e\x0f\x0c\x1e\x0f\x11\x1e\x14\x15\x00\x0f"
+        )
+        assert status == [
+            foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)
+        ]
+
+
+async def test_tuya_legacy_write_pipelined(zigpy_device_from_quirk):
+    """Test legacy manufacturer attribute writes are pipelined and aggregated."""
+
+    valve_dev = zigpy_device_from_quirk(zhaquirks.tuya.ts0601_trv.MoesHY368_Type1)
+    tuya_cluster = valve_dev.endpoints[1].tuya_manufacturer
+    thermostat_cluster = valve_dev.endpoints[1].thermostat
+    tuya_cluster.write_window = 2
+
+    eco_attr = t.uint16_t(zhaquirks.tuya.ts0601_trv.MOES_ECO_TEMP_ATTR).serialize()
+    in_flight = []
+    max_in_flight = 0
+
+    async def async_request(*args, **kwargs):
+        nonlocal max_in_flight
+        in_flight.append(kwargs["data"])
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(kwargs["data"])
+        if kwargs["data"][5:7] == eco_attr:
+            raise zigpy.exceptions.DeliveryError("Failed to deliver")
+        return foundation.Status.SUCCESS
+
+    with mock.patch.object(
+        tuya_cluster.endpoint, "request", side_effect=async_request
+    ) as m1:
+        (status,) = await thermostat_cluster.write_attributes(
+            {
+                "occupied_heating_setpoint": 2500,
+                "comfort_heating_setpoint": 2200,
+                "eco_heating_setpoint": 1800,
+            }
         )
-        datetime.datetime = origdatetime
+
+    assert m1.call_count == 3
+    assert max_in_flight == 2
+    assert [call.kwargs["data"][5:7] for call in m1.call_args_list] == [
+        b"\x02\x02",
+        b"\x6b\x02",
+        eco_attr,
+    ]
+    assert status == [
+        foundation.WriteAttributesStatusRecord(
+            foundation.Status.FAILURE,
+            thermostat_cluster.attributes_by_name["eco_heating_setpoint"].id,
+        )
+    ]
 
 
 @pytest.mark.parametrize("quirk", (zhaquirks.tuya.ts0601_electric_heating.MoesBHT,))
@@ -2046,3 +2149,105 @@ async def test_ts601_door_sensor(
     attrs = await cluster.read_attributes(attributes=[attribute])
 
     assert attrs[0].get(attribute) == expected_value
+
+
+def test_switch_bus_channel_routing(zigpy_device_from_quirk):
+    """Test switch events only reach the TuyaOnOff cluster of their channel."""
+    device = zigpy_device_from_quirk(zhaquirks.tuya.ts0601_din_power.HikingPowerMeter)
+    switch_bus = device.switch_bus
+    on_off = device.endpoints[16].on_off
+    on_off_listener = ClusterListener(on_off)
+    other_listener = mock.MagicMock(spec=["switch_event"])
+    switch_bus.add_listener(other_listener)
+
+    with mock.patch.object(
+        zhaquirks.tuya._LOGGER, "debug", wraps=zhaquirks.tuya._LOGGER.debug
+    ) as debug_mock:
+        switch_bus.listener_event(zhaquirks.tuya.SWITCH_EVENT, 1, 1)
+    # the cluster of channel 16 isn't called at all
+    assert debug_mock.call_count == 0
+    assert on_off_listener.attribute_updates == []
+    other_listener.switch_event.assert_called_once_with(1, 1)
+
+    # both paths call the other listeners before the listeners of the channel
+    manager = mock.MagicMock()
+    manager.attach_mock(other_listener.switch_event, "other")
+
+    class ChannelListener:
+        def switch_event(self, channel, state):
+            manager.channel(channel, state)
+
+    channel_listener = ChannelListener()
+    switch_bus.add_channel_listener(16, channel_listener)
+    switch_bus.listener_event(zhaquirks.tuya.SWITCH_EVENT, 16, 1)
+    switch_bus.emitter(zhaquirks.tuya.SWITCH_EVENT)(16, 0)
+    switch_bus.remove_listener(channel_listener)
+    assert manager.mock_calls == [
+        mock.call.other(16, 1),
+        mock.call.channel(16, 1),
+        mock.call.other(16, 0),
+        mock.call.channel(16, 0),
+    ]
+    assert on_off_listener.attribute_updates == [(0x0000, 1), (0x0000, 0)]
+
+    switch_bus.remove_listener(on_off)
+    switch_bus.emitter(zhaquirks.tuya.SWITCH_EVENT)(16, 1)
+    assert len(on_off_listener.attribute_updates) == 2
+    other_listener.switch_event.assert_called_with(16, 1)
+
+
+def test_tuya_capture_trace(zigpy_device_from_quirk, tmp_path):
+    """Test inbound frames are captured to a trace that can be read back."""
+
+    path = str(tmp_path / "tuya.trace")
+    valve_dev = zigpy_device_from_quirk(zhaquirks.tuya.ts0601_trv.MoesHY368_Type1)
+    tuya_cluster = valve_dev.endpoints[1].tuya_manufacturer
+    tuya_cluster.deserialize(ZCL_TUYA_VALVE_OFF)
+
+    # the second frame arrives after the milliseconds since start overflow
+    monotonic = mock.patch(
+        "zhaquirks.tuya.capture.time.monotonic",
+        side_effect=[10.0, 10.5, 4294978.5, 4294978.5],
+    )
+    wall_clock = mock.patch(
+        "zhaquirks.tuya.capture.time.time", side_effect=[1000.0, 4295968.5]
+    )
+    with monotonic, wall_clock:
+        capture.start(path)
+        try:
+            for frame in (ZCL_TUYA_VALVE_TEMPERATURE, ZCL_TUYA_SET_TIME_REQUEST):
+                tuya_cluster.deserialize(frame)
+        finally:
+            capture.stop()
+    tuya_cluster.deserialize(ZCL_TUYA_VALVE_OFF)
+
+    frames = list(capture.read_trace(path))
+    assert [(frame.command_id, frame.data) for frame in frames] == [
+        (0x02, ZCL_TUYA_VALVE_TEMPERATURE),
+        (0x24, ZCL_TUYA_SET_TIME_REQUEST),
+    ]
+    assert frames[0].device == frames[1].device
+    assert frames[0].device.ieee == valve_dev.ieee
+    assert frames[0].device.quirk == "zhaquirks.tuya.ts0601_trv.MoesHY368_Type1"
+    assert (frames[0].endpoint_id, frames[0].cluster_id) == (1, 0xEF00)
+    assert [frame.timestamp for frame in frames] == [1000.5, 4295968.5]
+
+
+def test_tuya_capture_error(zigpy_device_from_quirk, tmp_path, caplog):
+    """Test a failing capture is stopped without breaking the decoding."""
+
+    valve_dev = zigpy_device_from_quirk(zhaquirks.tuya.ts0601_trv.MoesHY368_Type1)
+    tuya_cluster = valve_dev.endpoints[1].tuya_manufacturer
+
+    recorder = capture.start(str(tmp_path / "tuya.trace"))
+    try:
+        with mock.patch.object(
+            recorder._file, "write", side_effect=OSError("No space left on device")
+        ):
+            hdr, args = tuya_cluster.deserialize(ZCL_TUYA_VALVE_TEMPERATURE)
+            assert hdr.command_id == 0x02
+            assert capture.recorder is None
+            tuya_cluster.deserialize(ZCL_TUYA_VALVE_OFF)
+    finally:
+        capture.stop()
+    assert caplog.text.count("stopping the capture") == 1
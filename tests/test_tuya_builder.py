@@ -1,6 +1,5 @@
 """Tests for TuyaQuirkBuilder."""
 
-import datetime
 from unittest import mock
 
 import pytest
@@ -10,8 +9,9 @@ import zigpy.types as t
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import Basic
 
-from tests.common import ClusterListener, MockDatetime, wait_for_zigpy_tasks
+from tests.common import ClusterListener, wait_for_zigpy_tasks
 import zhaquirks
+from zhaquirks import time_sync
 from zhaquirks.const import BatterySize
 from zhaquirks.tuya import (
     TUYA_QUERY_DATA,
@@ -343,9 +343,9 @@ async def test_tuya_mcu_set_time(device_mock):
         TUYA_SET_TIME
     ].is_manufacturer_specific
 
-    # Mock datetime
-    origdatetime = datetime.datetime
-    datetime.datetime = MockDatetime
+    # mock the shared clock, 02:00 UTC and 01:00 local time
+    now_patch = mock.patch.object(time_sync.service, "now", return_value=(7200, 3600))
+    now_patch.start()
 
     # simulate a SET_TIME message
     hdr, args = ep.tuya_manufacturer.deserialize(ZCL_TUYA_SET_TIME)
@@ -363,4 +363,4 @@ async def test_tuya_mcu_set_time(device_mock):
         assert not res_hdr[0].manufacturer
         assert not res_hdr[0].frame_control.is_manufacturer_specific
 
-    datetime.datetime = origdatetime  # restore datetime
+    now_patch.stop()
@@ -1,6 +1,29 @@
 """Test units for Tuya covers."""
 
-from zhaquirks.tuya.ts0601_cover import TuyaMoesCover0601
+import asyncio
+from unittest import mock
+
+import pytest
+from zigpy.zcl import foundation
+
+from tests.common import ClusterListener
+from zhaquirks.tuya import (
+    ATTR_COVER_DIRECTION,
+    ATTR_COVER_INVERTED,
+    ATTR_COVER_POSITION,
+    TUYA_DP_ID_COVER_INVERTED,
+    TUYA_DP_ID_DIRECTION_CHANGE,
+    TUYA_DP_ID_PERCENT_CONTROL,
+    TUYA_DP_ID_PERCENT_STATE,
+    TUYA_DP_TYPE_ENUM,
+    TUYA_DP_TYPE_VALUE,
+    TUYA_GET_DATA,
+    TuyaManufCluster,
+)
+from zhaquirks.tuya.ts0601_cover import (
+    TuyaMoesCover0601,
+    TuyaMoesCover0601_inv_position,
+)
 
 
 def test_ts601_moes_signature(assert_signature_matches_quirk):
@@ -20,3 +43,103 @@ def test_ts601_moes_signature(assert_signature_matches_quirk):
         "class": "zigpy.device.Device",
     }
     assert_signature_matches_quirk(TuyaMoesCover0601, signature)
+
+
+@pytest.mark.parametrize(
+    "quirk, inverted",
+    (
+        (TuyaMoesCover0601, False),
+        (TuyaMoesCover0601_inv_position, True),
+    ),
+)
+def test_ts601_cover_position_reports(zigpy_device_from_quirk, quirk, inverted):
+    """Test cover datapoints are mapped to position, direction and inversion."""
+
+    device = zigpy_device_from_quirk(quirk)
+    tuya_cluster = device.endpoints[1].tuya_manufacturer
+    cover_cluster = device.endpoints[1].window_covering
+    cover_listener = ClusterListener(cover_cluster)
+
+    def report(command_id, data):
+        hdr = foundation.ZCLHeader.cluster(tsn=1, command_id=TUYA_GET_DATA)
+        payload = TuyaManufCluster.Command(
+            status=0, tsn=1, command_id=command_id, function=0, data=data
+        )
+        tuya_cluster.handle_cluster_request(hdr, (payload,))
+
+    report(TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE, [4, 0, 0, 0, 30])
+    report(TUYA_DP_TYPE_ENUM + TUYA_DP_ID_DIRECTION_CHANGE, [1, 1])
+    report(TUYA_DP_TYPE_ENUM + TUYA_DP_ID_COVER_INVERTED, [1, 1])
+    report(TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL, [4, 0, 0, 0, 30])
+
+    assert cover_listener.attribute_updates == [
+        (ATTR_COVER_POSITION, 30 if inverted else 70),
+        (ATTR_COVER_DIRECTION, 1),
+        (ATTR_COVER_INVERTED, 1),
+        (ATTR_COVER_POSITION, 70 if inverted else 30),
+    ]
+
+
+async def test_ts601_cover_inverted_from_cache(zigpy_device_from_quirk):
+    """Test a cover_inverted value loaded into the attribute cache is honoured."""
+
+    device = zigpy_device_from_quirk(TuyaMoesCover0601)
+    tuya_cluster = device.endpoints[1].tuya_manufacturer
+    cover_cluster = device.endpoints[1].window_covering
+    cover_cluster.coalesce_window_s = 0
+    cover_listener = ClusterListener(cover_cluster)
+    # the app database restores the cache without calling _update_attribute
+    cover_cluster._attr_cache[ATTR_COVER_INVERTED] = 1
+
+    hdr = foundation.ZCLHeader.cluster(tsn=1, command_id=TUYA_GET_DATA)
+    payload = TuyaManufCluster.Command(
+        status=0,
+        tsn=1,
+        command_id=TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE,
+        function=0,
+        data=[4, 0, 0, 0, 30],
+    )
+    tuya_cluster.handle_cluster_request(hdr, (payload,))
+    assert cover_listener.attribute_updates == [(ATTR_COVER_POSITION, 30)]
+
+    async def async_success(*args, **kwargs):
+        return foundation.Status.SUCCESS
+
+    with mock.patch.object(
+        tuya_cluster.endpoint, "request", side_effect=async_success
+    ) as m1:
+        await cover_cluster.go_to_lift_percentage(40)
+        assert m1.call_args.kwargs["data"][-1] == 40
+
+
+async def test_ts601_cover_coalesced_positions(zigpy_device_from_quirk):
+    """Test a stream of lift percentage commands only sends the last one."""
+
+    device = zigpy_device_from_quirk(TuyaMoesCover0601)
+    tuya_cluster = device.endpoints[1].tuya_manufacturer
+    cover_cluster = device.endpoints[1].window_covering
+    cover_cluster.coalesce_window_s = 0.01
+
+    async def async_success(*args, **kwargs):
+        return foundation.Status.SUCCESS
+
+    with mock.patch.object(
+        tuya_cluster.endpoint, "request", side_effect=async_success
+    ) as m1:
+        results = await asyncio.gather(
+            *(cover_cluster.go_to_lift_percentage(value) for value in (10, 20, 30))
+        )
+        assert m1.call_count == 1
+        assert m1.call_args.kwargs["data"][-1] == 100 - 30
+        assert [result.status for result in results[:2]] == [
+            foundation.Status.SUCCESS,
+            foundation.Status.SUCCESS,
+        ]
+        assert results[2] == foundation.Status.SUCCESS
+
+        # open supersedes a pending position
+        pending = asyncio.ensure_future(cover_cluster.go_to_lift_percentage(50))
+        await asyncio.sleep(0)
+        await cover_cluster.up_open()
+        assert (await pending).status == foundation.Status.SUCCESS
+        assert m1.call_count == 2
@@ -1,14 +1,17 @@
 """Tests for Tuya quirks."""
 
-import datetime
+import asyncio
+import contextlib
+import sqlite3
 from unittest import mock
 
 import pytest
 from zigpy.zcl import foundation
 
-from tests.common import ClusterListener, MockDatetime
+from tests.common import ClusterListener
 import zhaquirks
-from zhaquirks.tuya import TUYA_MCU_VERSION_RSP, TUYA_SET_TIME, TuyaDPType
+from zhaquirks import message_rates, time_sync
+from zhaquirks.tuya import TUYA_MCU_VERSION_RSP, TUYA_SET_TIME, TuyaDPType, snapshots
 from zhaquirks.tuya.mcu import (
     ATTR_MCU_VERSION,
     TUYA_MCU_CONNECTION_STATUS,
@@ -186,9 +189,9 @@ async def test_tuya_mcu_set_time(zigpy_device_from_quirk, quirk):
     tuya_cluster = tuya_device.endpoints[1].tuya_manufacturer
     cluster_listener = ClusterListener(tuya_cluster)
 
-    # Mock datetime
-    origdatetime = datetime.datetime
-    datetime.datetime = MockDatetime
+    # mock the shared clock, 02:00 UTC and 01:00 local time
+    now_patch = mock.patch.object(time_sync.service, "now", return_value=(7200, 3600))
+    now_patch.start()
 
     # simulate a SET_TIME message
     hdr, args = tuya_cluster.deserialize(ZCL_TUYA_SET_TIME)
@@ -206,8 +209,7 @@ async def test_tuya_mcu_set_time(zigpy_device_from_quirk, quirk):
             TUYA_SET_TIME, [0, 0, 28, 32, 0, 0, 14, 16], expect_reply=False
         )
 
-    # restore datetime
-    datetime.datetime = origdatetime  # restore datetime
+    now_patch.stop()
 
 
 @pytest.mark.parametrize(
@@ -375,3 +377,93 @@ async def test_tuya_mcu_classes():
         TuyaClusterData(manufacturer="xiaomi")
     with pytest.raises(ValueError):
         TuyaClusterData(manufacturer=b"")
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_dimmer.TuyaDoubleSwitchDimmer,)
+)
+async def test_tuya_message_rates(zigpy_device_from_quirk, quirk):
+    """Test inbound Tuya frames and datapoints are counted per device."""
+
+    tuya_device = zigpy_device_from_quirk(quirk)
+    tuya_cluster = tuya_device.endpoints[1].tuya_manufacturer
+    # switch 1 and switch 2 on
+    frame = b"\x09\x10\x02\x00\x10\x01\x01\x00\x01\x01\x07\x01\x00\x01\x01"
+
+    hdr, args = tuya_cluster.deserialize(frame)
+    tuya_cluster.handle_message(hdr, args)
+    assert message_rates.top_devices() == []
+
+    message_rates.enable()
+    try:
+        for _ in range(2):
+            hdr, args = tuya_cluster.deserialize(frame)
+            tuya_cluster.handle_message(hdr, args)
+        assert message_rates.top_devices(kind=message_rates.VALUES) == [
+            (tuya_device.ieee, 4)
+        ]
+        totals = message_rates.tracker.totals(tuya_device.ieee)
+        assert totals[message_rates.FRAMES] == 2
+        assert totals[message_rates.UPDATES] == 4
+    finally:
+        message_rates.disable()
+
+
+async def test_tuya_power_configuration_write(zigpy_device_from_quirk):
+    """Test written battery percentages are doubled like reported ones."""
+
+    device = zigpy_device_from_quirk(zhaquirks.tuya.ts0001_fingerbot.TuyaFingerbot)
+    power_cluster = device.endpoints[1].power
+
+    message_rates.enable()
+    try:
+        await power_cluster.write_attributes({"battery_percentage_remaining": 50})
+        totals = message_rates.tracker.totals(device.ieee)
+    finally:
+        message_rates.disable()
+
+    assert power_cluster.get("battery_percentage_remaining") == 100
+    assert totals[message_rates.UPDATES] == 1
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_dimmer.TuyaDoubleSwitchDimmer,)
+)
+async def test_tuya_datapoint_snapshots(zigpy_device_from_quirk, quirk, tmp_path):
+    """Test reported datapoints are persisted and replayed into new devices."""
+
+    path = str(tmp_path / "snapshots.db")
+    # switch 1 and switch 2 on, level of dimmer 1
+    frame = b"\x09\x10\x02\x00\x10\x01\x01\x00\x01\x01\x07\x01\x00\x01\x01"
+    level = b"\x09\x11\x02\x00\x11\x02\x02\x00\x04\x00\x00\x01\xf4"
+
+    store = snapshots.enable(path)
+    try:
+        tuya_device = zigpy_device_from_quirk(quirk)
+        tuya_cluster = tuya_device.endpoints[1].tuya_manufacturer
+        for data in (frame, level):
+            hdr, args = tuya_cluster.deserialize(data)
+            tuya_cluster.handle_message(hdr, args)
+    finally:
+        snapshots.disable()
+    assert store._flush_handle is None
+
+    # a corrupt row replayed first doesn't stop the other datapoints
+    with contextlib.closing(sqlite3.connect(path)) as conn, conn:
+        rows = conn.execute("SELECT * FROM tuya_datapoints").fetchall()
+        conn.execute("DELETE FROM tuya_datapoints")
+        conn.executemany(
+            "INSERT INTO tuya_datapoints VALUES (?, ?, ?, ?)",
+            [(str(tuya_device.ieee), 3, 0, b"\x03\x02\x00"), *rows],
+        )
+
+    snapshots.enable(path)
+    try:
+        tuya_device = zigpy_device_from_quirk(quirk)
+        assert tuya_device.endpoints[1].on_off.get("on_off") is None
+        await asyncio.sleep(0)
+        assert tuya_device.endpoints[1].on_off.get("on_off") == 1
+        assert tuya_device.endpoints[2].on_off.get("on_off") == 1
+        assert tuya_device.endpoints[1].level.get("current_level") == 127
+    finally:
+        snapshots.disable()
@@ -554,6 +554,50 @@ async def test_io_sample_report(zigpy_device_from_quirk):
     assert analog_listeners[4].attribute_updates[0] == (0x0055, 3.305)
 
 
+async def test_io_sample_report_change_only(zigpy_device_from_quirk):
+    """Test unchanged samples don't generate attribute updates."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    xbee3_device.analog_deadband = 5
+
+    digital_listener = ClusterListener(xbee3_device.endpoints[0xD0].on_off)
+    analog_listener = ClusterListener(xbee3_device.endpoints[0xD0].analog_input)
+    supply_listener = ClusterListener(xbee3_device.endpoints[0xD7].analog_input)
+
+    def send_sample(data):
+        xbee3_device.packet_received(
+            t.ZigbeePacket(
+                profile_id=XBEE_PROFILE_ID,
+                cluster_id=XBEE_IO_CLUSTER,
+                src_ep=XBEE_DATA_ENDPOINT,
+                dst_ep=XBEE_DATA_ENDPOINT,
+                data=t.SerializableBytes(data),
+            )
+        )
+
+    send_sample(b"\x01\x55\x55\x85\x11\x11\x01\x55\x02\xaa\x0c\xe9")
+    send_sample(b"\x01\x55\x55\x85\x11\x11\x01\x55\x02\xaa\x0c\xe9")
+
+    assert digital_listener.attribute_updates == [(0x0000, 1)]
+    assert len(analog_listener.attribute_updates) == 1
+    assert supply_listener.attribute_updates == [(0x0055, 3.305)]
+
+    # pin 0 goes low, AD0 moves within the deadband
+    send_sample(b"\x01\x55\x55\x85\x11\x10\x01\x57\x02\xaa\x0c\xe9")
+
+    assert digital_listener.attribute_updates == [(0x0000, 1), (0x0000, 0)]
+    assert len(analog_listener.attribute_updates) == 1
+    assert len(supply_listener.attribute_updates) == 1
+
+    # AD0 moves outside of the deadband
+    send_sample(b"\x01\x55\x55\x85\x11\x10\x01\x68\x02\xaa\x0c\xe9")
+
+    assert len(digital_listener.attribute_updates) == 2
+    assert len(analog_listener.attribute_updates) == 2
+    assert 35.19061 < analog_listener.attribute_updates[1][1] < 35.19062
+    assert len(supply_listener.attribute_updates) == 1
+
+
 async def test_io_sample_report_on_at_response(zigpy_device_from_quirk):
     """Test update samples on non-native IS command response."""
 
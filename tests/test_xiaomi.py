@@ -33,6 +33,7 @@ from zigpy.zcl.clusters.smartenergy import Metering
 
 from tests.common import ZCL_OCC_ATTR_RPT_OCC, ClusterListener
 import zhaquirks
+from zhaquirks import message_rates
 from zhaquirks.const import (
     BUTTON_1,
     BUTTON_2,
@@ -41,6 +42,7 @@ from zhaquirks.const import (
     INPUT_CLUSTERS,
     MANUFACTURER,
     MODEL,
+    MODELS_INFO,
     NODE_DESCRIPTOR,
     OFF,
     ON,
@@ -96,6 +98,7 @@ import zhaquirks.xiaomi.aqara.smoke
 import zhaquirks.xiaomi.aqara.switch_t1
 from zhaquirks.xiaomi.aqara.thermostat_agl001 import ScheduleEvent, ScheduleSettings
 import zhaquirks.xiaomi.aqara.weather
+import zhaquirks.xiaomi.aqara.wleak_aq1
 import zhaquirks.xiaomi.mija.motion
 import zhaquirks.xiaomi.mija.smoke
 
@@ -136,6 +139,29 @@ def test_basic_cluster_deserialize_wrong_len_2():
     assert deserialized[1]
 
 
+def test_xiaomi_report_message_rates(zigpy_device_from_quirk):
+    """Test the values of an Aqara report are counted once."""
+    device = zigpy_device_from_quirk(zhaquirks.xiaomi.aqara.wleak_aq1.LeakAQ1)
+    basic_cluster = device.endpoints[1].basic
+
+    data = b"\x1c_\x11\x12\n"
+    data += b'\x05\x00B\x15lumi.sensor_wleak.aq1\x01\xffB"\x01!\xb3\x0b\x03('
+    data += b"\x17\x04!\xa8C\x05!\xa7\x00\x06$\x00\x00\x00\x00\x00\x08!\x04"
+    data += b"\x02\n!\x00\x00d\x10\x01"
+
+    rates = message_rates.enable()
+    try:
+        hdr, args = basic_cluster.deserialize(data)
+        basic_cluster.handle_message(hdr, args)
+        totals = rates.totals(device.ieee)
+    finally:
+        message_rates.disable()
+
+    assert totals[message_rates.FRAMES] == 1
+    # the model and the 8 values packed into 0xFF01, but not 0xFF01 itself
+    assert totals[message_rates.VALUES] == 9
+
+
 @pytest.mark.parametrize(
     "quirk",
     (
@@ -323,6 +349,66 @@ def test_xiaomi_quick_init(raw_device):
     assert raw_device.application.device_initialized.call_count == 1
 
 
+@pytest.fixture
+def registered_quirks():
+    """Quirks registered by a test, removed from the registry afterwards."""
+
+    quirks = []
+    yield quirks
+    for quirk in quirks:
+        if quirk in zigpy.quirks.DEVICE_REGISTRY:
+            zigpy.quirks.DEVICE_REGISTRY.remove(quirk)
+
+
+def test_xiaomi_quick_init_negative_cache(raw_device, registered_quirks):
+    """Test quick init doesn't reparse messages from devices without a quirk."""
+
+    def quick_init_quirk(quirk_model):
+        class XiaomiQuirk(XiaomiQuickInitDevice):
+            signature = {
+                NODE_DESCRIPTOR: XIAOMI_NODE_DESC,
+                ENDPOINTS: {
+                    1: {
+                        PROFILE_ID: 0x0260,
+                        DEVICE_TYPE: 0x0000,
+                        INPUT_CLUSTERS: [],
+                        OUTPUT_CLUSTERS: [],
+                    }
+                },
+                MODELS_INFO: [(LUMI, quirk_model)],
+            }
+
+        registered_quirks.append(XiaomiQuirk)
+        return XiaomiQuirk
+
+    class WrongSignature(XiaomiQuickInitDevice):
+        signature = {MODELS_INFO: [(LUMI, "lumi.sensor_sm1ke")]}
+
+    registered_quirks.append(WrongSignature)
+    message = b"\x18\x00\n\x05\x00B\x11lumi.sensor_sm1ke\x01\x00 \x01"
+    with mock.patch(
+        "zigpy.zcl.foundation.ZCLHeader.deserialize",
+        wraps=foundation.ZCLHeader.deserialize,
+    ) as hdr_deserialize:
+        assert handle_quick_init(raw_device, 0x0260, 0, 1, 1, message) is None
+        assert handle_quick_init(raw_device, 0x0260, 0, 1, 1, message) is None
+        assert hdr_deserialize.call_count == 1
+
+    # replacing the quirk of the model keeps the number of quirks but is seen
+    zigpy.quirks.DEVICE_REGISTRY.remove(WrongSignature)
+    quick_init_quirk("lumi.sensor_sm1ke")
+    assert handle_quick_init(raw_device, 0x0260, 0, 1, 1, message) is True
+    assert raw_device.application.device_initialized.call_count == 1
+
+    # removed quirks aren't used anymore
+    other_device = zigpy.device.Device(
+        mock.MagicMock(), t.EUI64.convert("88:77:66:55:44:33:22:11"), 0x4321
+    )
+    zigpy.quirks.DEVICE_REGISTRY.remove(registered_quirks.pop())
+    assert handle_quick_init(other_device, 0x0260, 0, 1, 1, message) is None
+    assert other_device.application.device_initialized.call_count == 0
+
+
 @pytest.mark.parametrize(
     "voltage, bpr",
     (
@@ -677,6 +763,46 @@ async def test_aqara_feeder_write_attrs(
     )
 
 
+async def test_aqara_feeder_write_attrs_sequence(zigpy_device_from_quirk):
+    """Test Aqara C1 pet feeder settings are written as an ordered sequence."""
+
+    device = zigpy_device_from_quirk(AqaraFeederAcn001)
+    opple_cluster = device.endpoints[1].opple_cluster
+    opple_cluster._write_attributes = mock.AsyncMock(
+        side_effect=[
+            [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]],
+            [
+                [
+                    foundation.WriteAttributesStatusRecord(
+                        foundation.Status.INVALID_VALUE, FEEDER_ATTR
+                    )
+                ]
+            ],
+        ]
+    )
+
+    (records,) = await opple_cluster.write_attributes(
+        {"serving_size": 3, "portion_weight": 8}, manufacturer=0x115F
+    )
+
+    frames = [
+        call.args[0][0].value.value
+        for call in opple_cluster._write_attributes.await_args_list
+    ]
+    assert frames == [
+        b"\x00\x02\x01\x0e\\\x00U\x04\x00\x00\x00\x03",
+        b"\x00\x02\x03\x0e_\x00U\x04\x00\x00\x00\x08",
+    ]
+    assert records == [
+        foundation.WriteAttributesStatusRecord(
+            foundation.Status.SUCCESS, ZCL_SERVING_SIZE
+        ),
+        foundation.WriteAttributesStatusRecord(
+            foundation.Status.INVALID_VALUE, ZCL_PORTION_WEIGHT
+        ),
+    ]
+
+
 @pytest.mark.parametrize(
     "bytes_received, call_count, calls",
     [
@@ -1086,6 +1212,7 @@ async def test_xiaomi_e1_thermostat_schedule_settings_string_representation(
 
     s = ScheduleSettings(schedule_settings)
     assert str(s) == schedule_settings
+    assert str(ScheduleSettings(bytes(s))) == schedule_settings
 
 
 @pytest.mark.parametrize(
@@ -1109,6 +1236,7 @@ async def test_xiaomi_e1_thermostat_schedule_settings_string_representation(
         b"\x04>\x01\xe0\x00\x00\t`\x048\x00\x00\x06\xa4\x05d\x00\x00\x08\x98\x81\xe0\x00\x00\x08\x98\x00",
         b"\x00>\x01\xe0\x00\x00\t`\x048\x00\x00\x06\xa4\x05d\x00\x00\x08\x98\x81\xe0\x00\x00\x08\x98",
         b"\x04\x01\x01\xe0\x00\x00\t`\x048\x00\x00\x06\xa4\x05d\x00\x00\x08\x98\x81\xe0\x00\x00\x08\x98",
+        b"\x04>\x01\xe0\x00\x00\ta\x048\x00\x00\x06\xa4\x05d\x00\x00\x08\x98\x81\xe0\x00\x00\x08\x98",
         None,
     ],
 )
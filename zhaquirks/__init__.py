@@ -3,26 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
+import heapq
 import importlib
 import importlib.util
 import logging
+import math
 import pathlib
 import pkgutil
 import sys
+import time
 import typing
 from typing import Any
+import weakref
 
 import zigpy.device
 import zigpy.endpoint
 from zigpy.quirks import DEVICE_REGISTRY, CustomCluster, CustomDevice
 import zigpy.types as t
 from zigpy.util import ListenableMixin
+import zigpy.zcl
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import PowerConfiguration
 from zigpy.zcl.clusters.measurement import OccupancySensing
 from zigpy.zcl.clusters.security import IasZone
 from zigpy.zdo import types as zdotypes
 
+from . import message_rates, profiling
 from .const import (
     ATTRIBUTE_ID,
     ATTRIBUTE_NAME,
@@ -52,12 +60,250 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class Bus(ListenableMixin):
-    """Event bus implementation."""
+    """Event bus implementation.
+
+    Listener methods are looked up once per event name and cached until a listener
+    is added or removed.
+    """
 
     def __init__(self, *args, **kwargs):
         """Init event bus."""
         super().__init__(*args, **kwargs)
         self._listeners = {}
+        self._handlers: dict[str, tuple[typing.Callable, ...]] = {}
+
+    def _add_listener(self, listener: Any, include_context: bool) -> int:
+        self._handlers.clear()
+        return super()._add_listener(listener, include_context)
+
+    def remove_listener(self, listener: Any) -> None:
+        """Remove a listener."""
+        self._handlers.clear()
+        super().remove_listener(listener)
+
+    def handlers(self, method_name: str) -> tuple[typing.Callable, ...]:
+        """Return the listener methods called for `method_name` events."""
+        handlers = self._handlers.get(method_name)
+        if handlers is None:
+            handlers = []
+            for listener, include_context in self._listeners.values():
+                method = getattr(listener, method_name, None)
+                if method is None:
+                    continue
+                if include_context:
+                    method = functools.partial(method, self)
+                handlers.append(method)
+            handlers = self._handlers[method_name] = tuple(handlers)
+        return handlers
+
+    def listener_event(self, method_name: str, *args) -> list[Any]:
+        """Call `method_name` on all listeners and return their results."""
+        result = []
+        for handler in self.handlers(method_name):
+            self._call_handler(handler, args, result)
+        return result
+
+    def emitter(self, method_name: str) -> typing.Callable[..., None]:
+        """Return a function calling `method_name` on all listeners.
+
+        The returned function doesn't collect results. It looks the listener
+        methods up in the cache of `handlers` on every call, so listeners added or
+        removed after the function was created are taken into account.
+        """
+
+        def emit(*args) -> None:
+            for handler in self.handlers(method_name):
+                self._call_handler(handler, args)
+
+        return emit
+
+    @staticmethod
+    def _call_handler(handler, args, result: list | None = None) -> None:
+        try:
+            value = handler(*args)
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.debug(
+                "Error calling listener %r with args %r", handler, args, exc_info=exc
+            )
+            return
+        if result is not None:
+            result.append(value)
+
+
+class MultiPressQueue:
+    """Button queue deriving multi-press counts from presses within a time window.
+
+    A single loop timer is kept per press sequence. Presses received while it is
+    pending only move the deadline, the timer reschedules itself until no press
+    has been seen for `window_s` seconds and then reports the click count.
+    """
+
+    def __init__(self, window_s: float = 0.3):
+        """Init."""
+        self.window_s = window_s
+        self._click_counter = 0
+        self._deadline = 0.0
+        self._callback: typing.Callable[[int], None] = lambda x: None
+        self._timer_handle: asyncio.TimerHandle | None = None
+
+    def _fire(self):
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._deadline:
+            self._timer_handle = loop.call_at(self._deadline, self._fire)
+            return
+        self._timer_handle = None
+        self._callback(self._click_counter)
+
+    def press(self, callback: typing.Callable[[int], None]):
+        """Process a button press."""
+        loop = asyncio.get_running_loop()
+        self._callback = callback
+        self._deadline = loop.time() + self.window_s
+        if self._timer_handle is None:
+            self._click_counter = 1
+            self._timer_handle = loop.call_at(self._deadline, self._fire)
+        else:
+            self._click_counter += 1
+
+    def cancel(self):
+        """Drop a pending press sequence without reporting it."""
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+
+class ResetTimerWheel:
+    """Hashed timer wheel shared by self resetting clusters.
+
+    Deadlines are bucketed into `granularity` second slots and a single loop timer
+    is armed for the earliest one. Re-triggering a pending reset with a later
+    deadline only stores the new deadline, the entry is moved to its new slot when
+    its old slot comes up.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, granularity: float = 1.0):
+        """Init."""
+        self._loop = loop
+        self._granularity = granularity
+        # key -> [deadline, slot, callback]
+        self._entries: dict[typing.Hashable, list] = {}
+        # slot -> [earliest deadline, keys]
+        self._slots: dict[int, list] = {}
+        self._slot_heap: list[int] = []
+        self._timer_handle: asyncio.TimerHandle | None = None
+        self._timer_when = math.inf
+
+    def schedule(
+        self, key: typing.Hashable, delay: float, callback: typing.Callable[[], None]
+    ) -> None:
+        """Run `callback` in `delay` seconds, replacing a pending callback for `key`."""
+        deadline = self._loop.time() + delay
+        slot = int(deadline // self._granularity)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = [deadline, slot, callback]
+        else:
+            entry[0] = deadline
+            entry[2] = callback
+            if slot > entry[1]:
+                return
+            if slot < entry[1]:
+                self._slots[entry[1]][1].discard(key)
+                entry[1] = slot
+        self._add_to_slot(key, slot, deadline)
+        self._arm(self._slots[self._slot_heap[0]][0])
+
+    def cancel(self, key: typing.Hashable) -> bool:
+        """Cancel the pending callback for `key`, return whether there was one."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._slots[entry[1]][1].discard(key)
+        return True
+
+    def _add_to_slot(self, key, slot, deadline):
+        bucket = self._slots.get(slot)
+        if bucket is None:
+            self._slots[slot] = [deadline, {key}]
+            heapq.heappush(self._slot_heap, slot)
+            return
+        bucket[0] = min(bucket[0], deadline)
+        bucket[1].add(key)
+
+    def _arm(self, when):
+        if when >= self._timer_when:
+            return
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+        self._timer_when = when
+        self._timer_handle = self._loop.call_at(when, self._run)
+
+    def _run(self):
+        self._timer_handle = None
+        self._timer_when = math.inf
+        now = self._loop.time()
+        due = []
+
+        while self._slot_heap:
+            slot = self._slot_heap[0]
+            bucket = self._slots[slot]
+            if bucket[0] > now:
+                break
+
+            remaining = set()
+            remaining_deadline = math.inf
+            for key in bucket[1]:
+                entry = self._entries.get(key)
+                if entry is None or entry[1] != slot:
+                    continue
+                deadline = entry[0]
+                if deadline <= now:
+                    del self._entries[key]
+                    due.append(entry[2])
+                elif (new_slot := int(deadline // self._granularity)) != slot:
+                    entry[1] = new_slot
+                    self._add_to_slot(key, new_slot, deadline)
+                else:
+                    remaining.add(key)
+                    remaining_deadline = min(remaining_deadline, deadline)
+
+            if remaining:
+                bucket[0] = remaining_deadline
+                bucket[1] = remaining
+                break
+            heapq.heappop(self._slot_heap)
+            del self._slots[slot]
+
+        if self._slot_heap:
+            self._arm(self._slots[self._slot_heap[0]][0])
+
+        for callback in due:
+            self._run_callback(callback)
+
+    @staticmethod
+    def _run_callback(callback):
+        try:
+            callback()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error running reset callback %s", callback)
+
+
+_RESET_TIMER_WHEELS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, ResetTimerWheel
+] = weakref.WeakKeyDictionary()
+
+
+def reset_timer_wheel() -> ResetTimerWheel:
+    """Return the reset timer wheel of the running event loop."""
+    loop = asyncio.get_running_loop()
+    wheel = _RESET_TIMER_WHEELS.get(loop)
+    if wheel is None:
+        wheel = _RESET_TIMER_WHEELS[loop] = ResetTimerWheel(loop)
+    return wheel
+
+
+# (attribute id, success) -> read record without a value
+_READ_RECORD_TEMPLATES: dict[tuple[int, bool], foundation.ReadAttributeRecord] = {}
 
 
 class LocalDataCluster(CustomCluster):
@@ -71,6 +317,10 @@ class LocalDataCluster(CustomCluster):
     _CONSTANT_ATTRIBUTES: dict[int, typing.Any] = {}
     _VALID_ATTRIBUTES: set[int] = set()
 
+    def _update_attribute(self, attrid, value):
+        message_rates.record(self, message_rates.UPDATES)
+        super()._update_attribute(attrid, value)
+
     async def bind(self):
         """Prevent bind."""
         self.debug("binding LocalDataCluster")
@@ -88,43 +338,107 @@ class LocalDataCluster(CustomCluster):
 
     async def read_attributes_raw(self, attributes, manufacturer=None, **kwargs):
         """Prevent remote reads."""
-        msg = "reading attributes for LocalDataCluster"
-        self.debug(f"{msg}: attributes={attributes} manufacturer={manufacturer}")
-        records = [
-            foundation.ReadAttributeRecord(
-                attr, foundation.Status.UNSUPPORTED_ATTRIBUTE, foundation.TypeValue()
-            )
-            for attr in attributes
-        ]
-        for record in records:
-            if record.attrid in self._CONSTANT_ATTRIBUTES:
-                record.value.value = self._CONSTANT_ATTRIBUTES[record.attrid]
+        self.debug(
+            "reading attributes for LocalDataCluster: attributes=%s manufacturer=%s",
+            attributes,
+            manufacturer,
+        )
+        constants = self._CONSTANT_ATTRIBUTES
+        attr_cache = self._attr_cache
+        valid_attributes = self._VALID_ATTRIBUTES
+        records = []
+        for attrid in attributes:
+            if attrid in constants:
+                value = constants[attrid]
             else:
-                record.value.value = self._attr_cache.get(record.attrid)
-            if (
-                record.value.value is not None
-                or record.attrid in self._VALID_ATTRIBUTES
-            ):
-                record.status = foundation.Status.SUCCESS
+                value = attr_cache.get(attrid)
+            success = value is not None or attrid in valid_attributes
+            template = _READ_RECORD_TEMPLATES.get((attrid, success))
+            if template is None:
+                template = _READ_RECORD_TEMPLATES[(attrid, success)] = (
+                    foundation.ReadAttributeRecord(
+                        attrid,
+                        (
+                            foundation.Status.SUCCESS
+                            if success
+                            else foundation.Status.UNSUPPORTED_ATTRIBUTE
+                        ),
+                    )
+                )
+            # copying a template skips the attrid and status conversions, every
+            # read gets its own records as callers may modify them
+            record = foundation.ReadAttributeRecord(template)
+            record.value = foundation.TypeValue(None, value)
+            records.append(record)
         return (records,)
 
     async def write_attributes(self, attributes, manufacturer=None, **kwargs):
         """Prevent remote writes."""
-        msg = "writing attributes for LocalDataCluster"
-        self.debug(f"{msg}: attributes={attributes} manufacturer={manufacturer}")
+        self.debug(
+            "writing attributes for LocalDataCluster: attributes=%s manufacturer=%s",
+            attributes,
+            manufacturer,
+        )
+        attributes_by_name = self.attributes_by_name
+        updates = {}
         for attrid, value in attributes.items():
             if isinstance(attrid, str):
-                attrid = self.attributes_by_name[attrid].id
+                attrid = attributes_by_name[attrid].id
             elif attrid not in self.attributes:
                 self.error("%d is not a valid attribute id", attrid)
                 continue
-            self._update_attribute(attrid, value)
+            updates[attrid] = value
+        self._update_attributes(updates)
         return ([foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)],)
 
+    def _update_attributes(self, updates: dict[int, typing.Any]) -> None:
+        """Update several attributes, through `_update_attribute` one at a time."""
+        for attrid, value in updates.items():
+            self._update_attribute(attrid, value)
+
+
+@dataclasses.dataclass(frozen=True)
+class EventPolicy:
+    """Rate limiting policy for the attribute events of an `EventableCluster`.
+
+    `on_change` drops events repeating the last emitted value, `min_interval_ms`
+    drops events sent within that many milliseconds of the previous one and
+    `last_value_only` holds those back instead, emitting only the latest value once
+    the interval is over.
+    """
+
+    on_change: bool = False
+    min_interval_ms: int = 0
+    last_value_only: bool = False
+
+
+_NOT_EMITTED = object()
+
+
+class _EventState:
+    """Debounce state of a single attribute."""
+
+    __slots__ = ("value", "emitted_at", "pending")
+
+    def __init__(self):
+        """Init."""
+        self.value: Any = _NOT_EMITTED
+        self.emitted_at: float = -math.inf
+        self.pending: Any = _NOT_EMITTED
+
 
 class EventableCluster(CustomCluster):
     """Cluster that generates events."""
 
+    # attribute id -> policy for its attribute updated events, unlisted attributes
+    # emit an event on every update
+    event_policies: dict[int, EventPolicy] = {}
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._event_states: dict[int, _EventState] = {}
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -138,6 +452,7 @@ class EventableCluster(CustomCluster):
             self.server_commands is not None
             and self.server_commands.get(hdr.command_id) is not None
         ):
+            message_rates.record(self, message_rates.EVENTS)
             self.listener_event(
                 ZHA_SEND_EVENT,
                 self.server_commands.get(hdr.command_id, (hdr.command_id)).name,
@@ -147,6 +462,47 @@ class EventableCluster(CustomCluster):
     def _update_attribute(self, attrid, value):
         super()._update_attribute(attrid, value)
 
+        policy = self.event_policies.get(attrid)
+        if policy is None:
+            self._send_attribute_event(attrid, value)
+            return
+
+        state = self._event_states.get(attrid)
+        if state is None:
+            state = self._event_states[attrid] = _EventState()
+        if state.pending is not _NOT_EMITTED:
+            state.pending = value
+            return
+        if policy.on_change and state.value == value:
+            return
+
+        now = time.monotonic()
+        remaining = state.emitted_at + policy.min_interval_ms / 1000 - now
+        if remaining > 0:
+            if policy.last_value_only:
+                state.pending = value
+                reset_timer_wheel().schedule(
+                    (self, attrid),
+                    remaining,
+                    functools.partial(self._send_pending_event, attrid, policy),
+                )
+            return
+
+        state.value = value
+        state.emitted_at = now
+        self._send_attribute_event(attrid, value)
+
+    def _send_pending_event(self, attrid: int, policy: EventPolicy) -> None:
+        state = self._event_states[attrid]
+        value, state.pending = state.pending, _NOT_EMITTED
+        if policy.on_change and state.value == value:
+            return
+        state.value = value
+        state.emitted_at = time.monotonic()
+        self._send_attribute_event(attrid, value)
+
+    def _send_attribute_event(self, attrid: int, value: Any) -> None:
+        message_rates.record(self, message_rates.EVENTS)
         if attrid in self.attributes:
             attribute_name = self.attributes[attrid].name
         else:
@@ -255,10 +611,13 @@ class _Motion(CustomCluster, IasZone):
         """Init."""
         super().__init__(*args, **kwargs)
         self._loop = asyncio.get_running_loop()
-        self._timer_handle = None
+        self._reset_timer = reset_timer_wheel()
+
+    def _schedule_reset(self):
+        """Schedule the reset, postponing an already pending one."""
+        self._reset_timer.schedule(self, self.reset_s, self._turn_off)
 
     def _turn_off(self):
-        self._timer_handle = None
         self.debug("%s - Resetting motion sensor", self.endpoint.device.ieee)
         self.listener_event(
             CLUSTER_COMMAND, 253, ZONE_STATUS_CHANGE_COMMAND, [OFF, 0, 0, 0]
@@ -284,9 +643,7 @@ class MotionWithReset(_Motion):
         """Handle the cluster command."""
         # check if the command is for a zone status change of ZoneStatus.Alarm_1 or ZoneStatus.Alarm_2
         if hdr.command_id == ZONE_STATUS_CHANGE_COMMAND and args[0] & 3:
-            if self._timer_handle:
-                self._timer_handle.cancel()
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._schedule_reset()
             if self.send_occupancy_event:
                 self.endpoint.device.occupancy_bus.listener_event(OCCUPANCY_EVENT)
 
@@ -308,11 +665,7 @@ class MotionOnEvent(_Motion):
         )
 
         self.debug("%s - Received motion event message", self.endpoint.device.ieee)
-
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+        self._schedule_reset()
 
 
 class _Occupancy(CustomCluster, OccupancySensing):
@@ -323,11 +676,14 @@ class _Occupancy(CustomCluster, OccupancySensing):
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
-        self._timer_handle = None
         self._loop = asyncio.get_running_loop()
+        self._reset_timer = reset_timer_wheel()
+
+    def _schedule_reset(self):
+        """Schedule the reset, postponing an already pending one."""
+        self._reset_timer.schedule(self, self.reset_s, self._turn_off)
 
     def _turn_off(self):
-        self._timer_handle = None
         self._update_attribute(OCCUPANCY_STATE, OFF)
 
 
@@ -342,11 +698,7 @@ class OccupancyOnEvent(_Occupancy):
     def occupancy_event(self):
         """Occupancy event."""
         self._update_attribute(OCCUPANCY_STATE, ON)
-
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+        self._schedule_reset()
 
 
 class OccupancyWithReset(_Occupancy):
@@ -356,10 +708,8 @@ class OccupancyWithReset(_Occupancy):
         super()._update_attribute(attrid, value)
 
         if attrid == OCCUPANCY_STATE and value == ON:
-            if self._timer_handle:
-                self._timer_handle.cancel()
             self.endpoint.device.motion_bus.listener_event(MOTION_EVENT)
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._schedule_reset()
 
 
 class QuickInitDevice(CustomDevice):
@@ -367,38 +717,98 @@ class QuickInitDevice(CustomDevice):
 
     signature: dict[str, Any] | None = None
 
+    @classmethod
+    def _signature_template(cls) -> tuple:
+        """Return the endpoint template compiled from the quirk signature.
+
+        Each endpoint is `(endpoint id, profile id, device type, input clusters,
+        output clusters)` with clusters as `(cluster id, cluster class, basic
+        attribute ids)`. The cluster class is None for clusters not registered by id
+        and the `(manufacturer, model)` basic attribute ids are None for non basic
+        clusters. The template is compiled once per class and signature contents.
+        """
+        key = tuple(
+            (
+                ep_id,
+                ep_data[PROFILE_ID],
+                ep_data[DEVICE_TYPE],
+                tuple(ep_data[INPUT_CLUSTERS]),
+                tuple(ep_data[OUTPUT_CLUSTERS]),
+            )
+            for ep_id, ep_data in cls.signature[ENDPOINTS].items()
+        )
+        cached = cls.__dict__.get("_SIGNATURE_TEMPLATE")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        def cluster_template(cluster_id: int) -> tuple:
+            cluster_type = zigpy.zcl.Cluster._registry.get(cluster_id)  # pylint: disable=W0212
+            if cluster_type is None or cluster_type.ep_attribute != "basic":
+                return cluster_id, cluster_type, None
+            attributes_by_name = cluster_type.attributes_by_name
+            basic_attrs = (
+                attributes_by_name[MANUFACTURER].id,
+                attributes_by_name[MODEL].id,
+            )
+            return cluster_id, cluster_type, basic_attrs
+
+        template = tuple(
+            (
+                ep_id,
+                profile_id,
+                device_type,
+                tuple(cluster_template(c) for c in in_clusters),
+                tuple(cluster_template(c) for c in out_clusters),
+            )
+            for ep_id, profile_id, device_type, in_clusters, out_clusters in key
+        )
+        cls._SIGNATURE_TEMPLATE = (key, template)
+        return template
+
     @classmethod
     def from_signature(
         cls, device: zigpy.device.Device, model: str | None = None
     ) -> zigpy.device.Device:
         """Update device accordingly to quirk signature."""
 
-        assert isinstance(cls.signature, dict)
-        if model is None:
-            model = cls.signature[MODEL]
-        manufacturer = cls.signature.get(MANUFACTURER)
+        signature = cls.signature
+        assert isinstance(signature, dict)
+        node_desc = signature[NODE_DESCRIPTOR]
+        manufacturer = signature.get(MANUFACTURER)
         if manufacturer is None:
-            manufacturer = cls.signature[MODELS_INFO][0][0]
+            manufacturer = signature[MODELS_INFO][0][0]
+        if model is None:
+            model = signature[MODEL]
+        endpoints = cls._signature_template()
 
-        device.node_desc = cls.signature[NODE_DESCRIPTOR]
+        device.node_desc = node_desc
 
-        endpoints = cls.signature[ENDPOINTS]
-        for ep_id, ep_data in endpoints.items():
+        for ep_id, profile_id, device_type, in_clusters, out_clusters in endpoints:
             endpoint = device.add_endpoint(ep_id)
-            endpoint.profile_id = ep_data[PROFILE_ID]
-            endpoint.device_type = ep_data[DEVICE_TYPE]
-            for cluster_id in ep_data[INPUT_CLUSTERS]:
-                cluster = endpoint.add_input_cluster(cluster_id)
-                if cluster.ep_attribute == "basic":
-                    manuf_attr_id = cluster.attributes_by_name[MANUFACTURER].id
+            endpoint.profile_id = profile_id
+            endpoint.device_type = device_type
+            for cluster_id, cluster_type, basic_attrs in in_clusters:
+                if cluster_type is None or cluster_id in endpoint.in_clusters:
+                    cluster = endpoint.add_input_cluster(cluster_id)
+                else:
+                    cluster = endpoint.add_input_cluster(
+                        cluster_id, cluster_type(endpoint, is_server=True)
+                    )
+                if basic_attrs is not None:
+                    manuf_attr_id, model_attr_id = basic_attrs
                     cluster._update_attribute(  # pylint: disable=W0212
                         manuf_attr_id, manufacturer
                     )
                     cluster._update_attribute(  # pylint: disable=W0212
-                        cluster.attributes_by_name[MODEL].id, model
+                        model_attr_id, model
+                    )
+            for cluster_id, cluster_type, _ in out_clusters:
+                if cluster_type is None or cluster_id in endpoint.out_clusters:
+                    endpoint.add_output_cluster(cluster_id)
+                else:
+                    endpoint.add_output_cluster(
+                        cluster_id, cluster_type(endpoint, is_server=False)
                     )
-            for cluster_id in ep_data[OUTPUT_CLUSTERS]:
-                endpoint.add_output_cluster(cluster_id)
             endpoint.status = zigpy.endpoint.Status.ZDO_INIT
 
         device.status = zigpy.device.Status.ENDPOINTS_INIT
@@ -460,9 +870,18 @@ def setup(custom_quirks_path: str | None = None) -> None:
         _LOGGER.debug("Loading quirks module %r", modname)
         importlib.import_module(modname)
 
-    if custom_quirks_path is None:
-        return
+    if custom_quirks_path is not None:
+        _load_custom_quirks(custom_quirks_path)
+
+    profiling.enable_from_env()
+
+    from zhaquirks.tuya import capture, snapshots  # noqa: PLC0415
+
+    snapshots.enable_from_env()
+    capture.start_from_env()
+
 
+def _load_custom_quirks(custom_quirks_path: str) -> None:
     path = pathlib.Path(custom_quirks_path)
     _LOGGER.debug("Loading custom quirks from %r", path)
 
@@ -28,9 +28,8 @@ Broken ZCL attributes:
     0x0204 - TemperatureDisplayMode (0x0000): Writing doesn't seem to do anything
 """
 
+import asyncio
 from collections.abc import Callable
-from datetime import UTC, datetime
-import time
 from typing import Any
 
 from zigpy import types
@@ -48,6 +47,7 @@ from zigpy.zcl.clusters.homeautomation import Diagnostic
 from zigpy.zcl.clusters.hvac import Thermostat, UserInterface
 from zigpy.zcl.foundation import ZCLAttributeDef, ZCLCommandDef
 
+from zhaquirks import time_sync
 from zhaquirks.const import (
     DEVICE_TYPE,
     ENDPOINTS,
@@ -183,6 +183,10 @@ class CustomizedStandardCluster(CustomCluster):
         else:
             return [success_global]
 
+    # Send the manufacturer specific and standard requests at the same time instead
+    # of waiting for the first response. Set to False for devices that can't handle it.
+    concurrent_split_requests: bool = True
+
     async def split_command(
         self,
         records: list[Any],
@@ -192,24 +196,27 @@ class CustomizedStandardCluster(CustomCluster):
         **kwargs,
     ):
         """Split execution of command in one for manufacturer specific and one for standard attributes."""
-        records_specific = [
-            e
-            for e in records
-            if self.attributes[extract_attrid(e)].is_manufacturer_specific
-        ]
-        records_standard = [
-            e
-            for e in records
-            if not self.attributes[extract_attrid(e)].is_manufacturer_specific
-        ]
-
-        result_specific = (
-            await func(records_specific, *args, **kwargs) if records_specific else []
-        )
-
-        result_standard = (
-            await func(records_standard, *args, **kwargs) if records_standard else []
-        )
+        records_specific = []
+        records_standard = []
+        for record in records:
+            if self.attributes[extract_attrid(record)].is_manufacturer_specific:
+                records_specific.append(record)
+            else:
+                records_standard.append(record)
+
+        if not records:
+            return self.combine_results()
+        if not records_specific or not records_standard:
+            return self.combine_results(await func(records, *args, **kwargs))
+
+        if self.concurrent_split_requests:
+            result_specific, result_standard = await asyncio.gather(
+                func(records_specific, *args, **kwargs),
+                func(records_standard, *args, **kwargs),
+            )
+        else:
+            result_specific = await func(records_specific, *args, **kwargs)
+            result_standard = await func(records_standard, *args, **kwargs)
 
         return self.combine_results(result_specific, result_standard)
 
@@ -453,20 +460,22 @@ class DanfossDiagnosticCluster(CustomizedStandardCluster, Diagnostic):
 class DanfossTimeCluster(CustomizedStandardCluster, Time):
     """Danfoss cluster for fixing the time."""
 
+    def __init__(self, *args, **kwargs):
+        """Init and keep the time of the device in sync periodically."""
+        super().__init__(*args, **kwargs)
+        time_sync.service.schedule(self.endpoint.device.ieee, self.write_time)
+
     async def write_time(self):
         """Write time info to Time Cluster.
 
-        It supports adjusting for daylight saving time, but this is not trivial to retrieve with the modules:
-            zoneinfo, datetime or time
+        The time zone is the current offset to UTC including DST, so periodic
+        writes also pick up DST changes.
         """
-        epoch = datetime(2000, 1, 1, 0, 0, 0, 0, tzinfo=UTC)
-        current_time = (datetime.now(UTC) - epoch).total_seconds()
-
         await self.write_attributes(
             {
-                "time": current_time,
+                "time": time_sync.service.seconds_since(2000),
                 "time_status": 0b00000010,  # only bit 1 can be set
-                "time_zone": time.timezone,
+                "time_zone": time_sync.service.utc_offset(),
             }
         )
 
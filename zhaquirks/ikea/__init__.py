@@ -1,6 +1,7 @@
 """Ikea module."""
 
 import logging
+import time
 
 from zigpy.quirks import CustomCluster
 import zigpy.types as t
@@ -205,6 +206,18 @@ class DoublingPowerConfigClusterIKEA(CustomCluster, PowerConfiguration):
     This implementation doubles battery pct remaining for IKEA devices with old firmware.
     """
 
+    # backoff between sw_build_id reads while the firmware version stays unknown
+    FW_READ_BACKOFF_MIN_S = 60
+    FW_READ_BACKOFF_MAX_S = 6 * 60 * 60
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._fw_read_pending = False
+        self._fw_read_backoff = 0
+        self._fw_read_not_before = 0.0
+        self._fw_new_decision = (None, True)
+
     async def bind(self):
         """Bind cluster and read the sw_build_id for later use."""
         result = await super().bind()
@@ -220,6 +233,16 @@ class DoublingPowerConfigClusterIKEA(CustomCluster, PowerConfiguration):
         if not sw_build_id:
             return True
 
+        # sw_build_id is persisted by zigpy, so the decision only needs to be made
+        # again when the firmware version changes
+        cached_sw_build_id, is_new = self._fw_new_decision
+        if sw_build_id != cached_sw_build_id:
+            is_new = self._parse_firmware_is_new(sw_build_id)
+            self._fw_new_decision = (sw_build_id, is_new)
+        return is_new
+
+    def _parse_firmware_is_new(self, sw_build_id):
+        """Check if the given sw_build_id is a firmware that does not require battery doubling."""
         # split sw_build_id into parts to check for new firmware
         split_fw_version = sw_build_id.split(".")
         if len(split_fw_version) >= 2:
@@ -246,7 +269,21 @@ class DoublingPowerConfigClusterIKEA(CustomCluster, PowerConfiguration):
     async def _read_fw_and_update_battery_pct(self, reported_battery_pct):
         """Read firmware version and update battery percentage remaining if necessary."""
         # read sw_build_id from device
-        await self.endpoint.basic.read_attributes([Basic.AttributeDefs.sw_build_id.id])
+        try:
+            await self.endpoint.basic.read_attributes(
+                [Basic.AttributeDefs.sw_build_id.id]
+            )
+        finally:
+            self._fw_read_pending = False
+            if self.endpoint.basic.get(Basic.AttributeDefs.sw_build_id.id) is None:
+                # don't retry on every battery report of a device that doesn't answer
+                self._fw_read_backoff = min(
+                    max(self._fw_read_backoff * 2, self.FW_READ_BACKOFF_MIN_S),
+                    self.FW_READ_BACKOFF_MAX_S,
+                )
+                self._fw_read_not_before = time.monotonic() + self._fw_read_backoff
+            else:
+                self._fw_read_backoff = 0
 
         # check if sw_build_id was read successfully and old firmware is installed
         # if so, update cache with reported battery percentage (doubled)
@@ -264,10 +301,14 @@ class DoublingPowerConfigClusterIKEA(CustomCluster, PowerConfiguration):
         """
         if attrid == PowerConfiguration.AttributeDefs.battery_percentage_remaining.id:
             # if sw_build_id is not cached, create task to read from device, since it should be awake now
+            # only one read is in flight at a time and failed reads are retried with a backoff
             if (
                 self.endpoint.basic.get(Basic.AttributeDefs.sw_build_id.id, None)
                 is None
+                and not self._fw_read_pending
+                and time.monotonic() >= self._fw_read_not_before
             ):
+                self._fw_read_pending = True
                 self.create_catching_task(self._read_fw_and_update_battery_pct(value))
 
             # double percentage if the firmware is confirmed old
@@ -0,0 +1,115 @@
+"""Optional per-device message rate accounting.
+
+When enabled, the zhaquirks base clusters count per device over a sliding window:
+
+- `frames`: inbound frames handled by Tuya and Xiaomi manufacturer clusters
+- `values`: datapoints and attributes decoded from those frames
+- `updates`: attribute updates of local data clusters, e.g. from decoded values
+- `events`: ZHA events emitted by eventable clusters
+
+This makes chatty devices easy to find with `top_devices()`. Counting is disabled
+by default.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from typing import Any
+
+import zigpy.types as t
+
+FRAMES = "frames"
+VALUES = "values"
+UPDATES = "updates"
+EVENTS = "events"
+KINDS = (FRAMES, VALUES, UPDATES, EVENTS)
+_KIND_INDEX = {kind: index for index, kind in enumerate(KINDS, start=1)}
+
+
+class MessageRates:
+    """Per-device message counters over a sliding window of one second buckets."""
+
+    def __init__(self, window_s: int = 60):
+        """Init."""
+        self.window_s = window_s
+        # ieee -> [bucket seconds, counts per kind...], each a ring of buckets
+        self._devices: dict[t.EUI64, list[list[int]]] = {}
+
+    def record(self, ieee: t.EUI64, kind: str, count: int = 1) -> None:
+        """Count `count` messages of `kind` for a device."""
+        now = int(time.monotonic())
+        window_s = self.window_s
+        buckets = self._devices.get(ieee)
+        if buckets is None:
+            buckets = self._devices[ieee] = [[-1] * window_s] + [
+                [0] * window_s for _ in KINDS
+            ]
+
+        index = now % window_s
+        if buckets[0][index] != now:
+            buckets[0][index] = now
+            for counts in buckets[1:]:
+                counts[index] = 0
+        buckets[_KIND_INDEX[kind]][index] += count
+
+    def totals(self, ieee: t.EUI64) -> dict[str, int]:
+        """Return the message counts of a device within the window."""
+        buckets = self._devices.get(ieee)
+        if buckets is None:
+            return dict.fromkeys(KINDS, 0)
+
+        oldest = int(time.monotonic()) - self.window_s
+        current = [index for index, second in enumerate(buckets[0]) if second > oldest]
+        return {
+            kind: sum(buckets[kind_index][index] for index in current)
+            for kind, kind_index in _KIND_INDEX.items()
+        }
+
+    def snapshot(self) -> dict[t.EUI64, dict[str, int]]:
+        """Return the message counts of all devices with messages in the window."""
+        result = {}
+        for ieee in list(self._devices):
+            totals = self.totals(ieee)
+            if any(totals.values()):
+                result[ieee] = totals
+            else:
+                del self._devices[ieee]
+        return result
+
+    def top_devices(
+        self, count: int = 10, kind: str = FRAMES
+    ) -> list[tuple[t.EUI64, int]]:
+        """Return up to `count` `(ieee, messages)` pairs with the most messages."""
+        totals = [(ieee, rates[kind]) for ieee, rates in self.snapshot().items()]
+        return heapq.nlargest(count, totals, key=lambda item: item[1])
+
+
+tracker: MessageRates | None = None
+
+
+def enable(window_s: int = 60) -> MessageRates:
+    """Start counting messages per device over a `window_s` seconds window."""
+    global tracker  # noqa: PLW0603
+    if tracker is None or tracker.window_s != window_s:
+        tracker = MessageRates(window_s)
+    return tracker
+
+
+def disable() -> None:
+    """Stop counting messages and drop the counters."""
+    global tracker  # noqa: PLW0603
+    tracker = None
+
+
+def record(cluster: Any, kind: str, count: int = 1) -> None:
+    """Count messages of `kind` for the device of a cluster, if enabled."""
+    if tracker is not None and count:
+        tracker.record(cluster.endpoint.device.ieee, kind, count)
+
+
+def top_devices(count: int = 10, kind: str = FRAMES) -> list[tuple[t.EUI64, int]]:
+    """Return the devices with the most messages of `kind` in the window."""
+    if tracker is None:
+        return []
+    return tracker.top_devices(count, kind)
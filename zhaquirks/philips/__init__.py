@@ -1,9 +1,8 @@
 """Module for Philips quirks implementations."""
 
-import asyncio
+import functools
 import itertools
 import logging
-import time
 from typing import Any, Final, Optional, Union
 
 from zigpy.quirks import CustomCluster
@@ -13,6 +12,7 @@ from zigpy.zcl.clusters.general import Basic
 from zigpy.zcl.clusters.measurement import OccupancySensing
 from zigpy.zcl.foundation import ZCLAttributeDef
 
+from zhaquirks import MultiPressQueue
 from zhaquirks.const import (
     ARGS,
     BUTTON,
@@ -74,33 +74,9 @@ class PhilipsBasicCluster(CustomCluster, Basic):
         await self.write_attributes(self.attr_config, manufacturer=0x100B)
 
 
-class ButtonPressQueue:
+class ButtonPressQueue(MultiPressQueue):
     """Philips button queue to derive multiple press events."""
 
-    def __init__(self):
-        """Init."""
-        self._ms_threshold = 300
-        self._ms_last_click = 0
-        self._click_counter = 1
-        self._callback = lambda x: None
-        self._task = None
-
-    async def _job(self):
-        await asyncio.sleep(self._ms_threshold / 1000)
-        self._callback(self._click_counter)
-
-    def press(self, callback):
-        """Process a button press."""
-        self._callback = callback
-        now_ms = time.time() * 1000
-        if now_ms - self._ms_last_click > self._ms_threshold:
-            self._click_counter = 1
-        else:
-            self._task.cancel()
-            self._click_counter += 1
-        self._ms_last_click = now_ms
-        self._task = asyncio.ensure_future(self._job())
-
 
 class Button:
     """Represents a remote button, including string literals used in triggers and actions."""
@@ -178,11 +154,81 @@ class PhilipsRemoteCluster(CustomCluster):
         PressType(SHORT_PRESS, COMMAND_PRESS),
         PressType(SHORT_RELEASE, COMMAND_M_SHORT_RELEASE),
     ]
+    # Maximum pause in seconds between short releases of a multi-press
+    MULTI_PRESS_WINDOW_S: float = 0.3
 
     def __init__(self, endpoint, is_server=True):
         """Initialize button press queue for each button."""
         super().__init__(endpoint, is_server)
-        self.button_press_queue = {k: ButtonPressQueue() for k in self.BUTTONS}
+        self.button_press_queue = {
+            k: ButtonPressQueue(self.MULTI_PRESS_WINDOW_S) for k in self.BUTTONS
+        }
+        self._press_events, self._multi_press_events = self._event_tables()
+
+    @classmethod
+    def _event_tables(cls):
+        """Return the action tables for this class, building them on first use.
+
+        The press table maps `(button id, press type id)` to the button id,
+        action, press type arg and whether the press is a multi-press candidate.
+        The multi-press table maps `(button id, click count)` to the
+        `(action, press type arg, args[2])` events emitted for that count.
+        """
+        tables = cls.__dict__.get("_EVENT_TABLES")
+        if tables is not None:
+            return tables
+
+        press_types = dict(cls.PRESS_TYPES)
+        if cls.SIMULATE_SHORT_EVENTS is not None:
+            press_types.setdefault(2, cls.SIMULATE_SHORT_EVENTS[1])
+
+        click_press_types: dict[int, PressType | None] = {
+            count: cls.MULTI_PRESS_EVENTS.get(count) for count in range(2, 6)
+        }
+        click_press_types[1] = cls.PRESS_TYPES.get(0) or (
+            cls.SIMULATE_SHORT_EVENTS[0] if cls.SIMULATE_SHORT_EVENTS else None
+        )
+        release_press_type = cls.PRESS_TYPES.get(2) or (
+            cls.SIMULATE_SHORT_EVENTS[1] if cls.SIMULATE_SHORT_EVENTS else None
+        )
+
+        press_events = {}
+        multi_press_events = {}
+        for button_id, button in cls.BUTTONS.items():
+            for press_type_id, press_type in press_types.items():
+                press_events[(button_id, press_type_id)] = (
+                    button.id,
+                    f"{button.action}_{press_type.action}",
+                    press_type.arg,
+                    press_type.name == SHORT_RELEASE,
+                )
+
+            for count, click_type in click_press_types.items():
+                if click_type is None:
+                    continue
+                events = [
+                    (
+                        f"{button.action}_{click_type.action}",
+                        click_type.arg,
+                        0 if count < 2 else 2 + count,
+                    )
+                ]
+                # simulate short release event, if needed for this device type
+                if (
+                    click_type.name == SHORT_PRESS
+                    and cls.SIMULATE_SHORT_EVENTS is not None
+                ):
+                    events.append(
+                        (
+                            f"{button.action}_{release_press_type.action}",
+                            release_press_type.arg,
+                            2,
+                        )
+                    )
+                multi_press_events[(button_id, count)] = tuple(events)
+
+        cls._EVENT_TABLES = (press_events, multi_press_events)
+        return cls._EVENT_TABLES
 
     def handle_cluster_request(
         self,
@@ -194,123 +240,46 @@ class PhilipsRemoteCluster(CustomCluster):
         ] = None,
     ):
         """Handle the cluster command."""
-        _LOGGER.debug(
-            "%s - handle_cluster_request tsn: [%s] command id: %s - args: [%s]",
-            self.__class__.__name__,
-            hdr.tsn,
-            hdr.command_id,
-            args,
-        )
-
-        button = self.BUTTONS.get(args[0])
-        # Bail on unknown buttons. (This gets rid of dial button "presses")
-        if button is None:
+        press_event = self._press_events.get((args[0], args[2]))
+        # Bail on unknown buttons and press types. (This gets rid of dial button "presses")
+        if press_event is None:
             _LOGGER.debug(
-                "%s - handle_cluster_request unknown button id [%s]",
+                "%s - handle_cluster_request unknown button id [%s] or press type [%s]",
                 self.__class__.__name__,
                 args[0],
+                args[2],
             )
             return
-        _LOGGER.debug(
-            "%s - handle_cluster_request button id: [%s], button name: [%s]",
-            self.__class__.__name__,
-            args[0],
-            button,
-        )
-
-        press_type = self.PRESS_TYPES.get(args[2])
-        if (
-            press_type is None
-            and self.SIMULATE_SHORT_EVENTS is not None
-            and args[2] == 2
-        ):
-            press_type = self.SIMULATE_SHORT_EVENTS[1]
-        if press_type is None:
-            _LOGGER.debug(
-                "%s - handle_cluster_request unknown button press type: [%s]",
-                self.__class__.__name__,
-                press_type,
-            )
-            return
-
-        duration = args[4]
-        _LOGGER.debug(
-            "%s - handle_cluster_request button press type: [%s], duration: [%s]",
-            self.__class__.__name__,
-            press_type,
-            duration,
-        )
 
+        button_id, action, press_type_arg, multi_press = press_event
         event_args = {
-            BUTTON: button.id,
-            PRESS_TYPE: press_type.arg,
+            BUTTON: button_id,
+            PRESS_TYPE: press_type_arg,
             COMMAND_ID: hdr.command_id,
-            "duration": duration,
+            "duration": args[4],
             ARGS: args,
         }
 
-        def send_press_event(click_count):
-            _LOGGER.debug(
-                "%s - send_press_event click_count: [%s]",
-                self.__class__.__name__,
-                click_count,
-            )
-            press_type = None
-            if click_count == 1:
-                press_type = self.PRESS_TYPES.get(0) or self.SIMULATE_SHORT_EVENTS[0]
-            elif click_count > 1:
-                press_type = self.MULTI_PRESS_EVENTS[min(click_count, 5)]
-
-            _LOGGER.debug(
-                "%s - send_press_event evaluated press_type: [%s]",
-                self.__class__.__name__,
-                press_type,
-            )
-            if press_type is not None:
-                # Override PRESS_TYPE
-                event_args[PRESS_TYPE] = press_type.arg
-                event_args[ARGS] = list(event_args[ARGS])
-                event_args[ARGS][2] = 0 if click_count < 2 else 2 + min(click_count, 5)
-                action = f"{button.action}_{press_type.action}"
-                _LOGGER.debug(
-                    "%s - send_press_event emitting action: [%s] event_args: %s",
-                    self.__class__.__name__,
-                    action,
-                    event_args,
-                )
-                self.listener_event(ZHA_SEND_EVENT, action, event_args)
-
-            # simulate short release event, if needed for this device type
-            if (
-                press_type.name == SHORT_PRESS
-                and self.SIMULATE_SHORT_EVENTS is not None
-            ):
-                press_type = self.PRESS_TYPES.get(2) or self.SIMULATE_SHORT_EVENTS[1]
-                sim_event_args = event_args.copy()
-                sim_event_args[PRESS_TYPE] = press_type.arg
-                sim_event_args[ARGS] = sim_event_args[ARGS].copy()
-                sim_event_args[ARGS][2] = 2
-                action = f"{button.action}_{press_type.action}"
-                _LOGGER.debug(
-                    "%s - send_press_event emitting simulated action: [%s], event_args: %s",
-                    self.__class__.__name__,
-                    action,
-                    sim_event_args,
-                )
-                self.listener_event(ZHA_SEND_EVENT, action, sim_event_args)
-
         # Derive Multiple Presses
-        if press_type.name == SHORT_RELEASE:
-            _LOGGER.debug(
-                "%s - handle_cluster_request handling short release. Push to button press queue for button %s",
-                self.__class__.__name__,
-                args[0],
+        if multi_press:
+            self.button_press_queue[args[0]].press(
+                functools.partial(self._send_press_event, args[0], event_args)
             )
-            self.button_press_queue[args[0]].press(send_press_event)
         else:
-            action = f"{button.action}_{press_type.action}"
             self.listener_event(ZHA_SEND_EVENT, action, event_args)
 
+    def _send_press_event(self, button_id, event_args, click_count):
+        """Emit the events for a completed press sequence."""
+        events = self._multi_press_events.get((button_id, min(click_count, 5)), ())
+        for action, press_type_arg, press_type_id in events:
+            args = list(event_args[ARGS])
+            args[2] = press_type_id
+            self.listener_event(
+                ZHA_SEND_EVENT,
+                action,
+                {**event_args, PRESS_TYPE: press_type_arg, ARGS: args},
+            )
+
     @classmethod
     def generate_device_automation_triggers(cls, additional=None):
         """Generate automation triggers based on device buttons and press-types."""
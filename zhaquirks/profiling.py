@@ -0,0 +1,167 @@
+"""Opt-in profiling of quirk cluster hot paths.
+
+When enabled, `handle_cluster_request`, `_update_attribute`, `deserialize` and
+`write_attributes` implemented by zhaquirks clusters are wrapped to record call
+counts and latency histograms per quirk and cluster. Nothing is wrapped while
+profiling is disabled.
+
+Profiling is enabled by `enable()` or by setting the `ZHAQUIRKS_PROFILING`
+environment variable before `zhaquirks.setup()` runs. Latencies of coroutines
+like `write_attributes` include the time spent waiting for the device.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import time
+from typing import Any
+
+from zigpy.quirks import CustomCluster
+
+_LOGGER = logging.getLogger(__name__)
+
+ENV_VAR = "ZHAQUIRKS_PROFILING"
+PROFILED_METHODS = (
+    "handle_cluster_request",
+    "_update_attribute",
+    "deserialize",
+    "write_attributes",
+)
+# latencies are bucketed by powers of two microseconds, the last bucket is open
+HISTOGRAM_BUCKETS = 24
+
+# (class, method name) -> original function
+_originals: dict[tuple[type, str], Callable] = {}
+# (quirk, cluster, method name) -> [count, total ns, max ns, histogram]
+_stats: dict[tuple[str, str, str], list] = {}
+# (id of the cluster, method name) of the calls being timed by the current task,
+# to skip super() calls while timing overlapping calls of other tasks
+_active: contextvars.ContextVar[frozenset[tuple[int, str]]] = contextvars.ContextVar(
+    "_active", default=frozenset()
+)
+
+
+def is_enabled() -> bool:
+    """Return whether profiling is enabled."""
+    return bool(_originals)
+
+
+def enable() -> None:
+    """Start profiling the clusters of all loaded zhaquirks modules."""
+    for cluster_type in _iter_cluster_types(CustomCluster):
+        module = cluster_type.__module__
+        if module != "zhaquirks" and not module.startswith("zhaquirks."):
+            continue
+        for name in PROFILED_METHODS:
+            func = cluster_type.__dict__.get(name)
+            if not inspect.isfunction(func) or (cluster_type, name) in _originals:
+                continue
+            _originals[cluster_type, name] = func
+            setattr(cluster_type, name, _wrap(func, name))
+    _LOGGER.debug("Profiling %d quirk cluster methods", len(_originals))
+
+
+def enable_from_env() -> None:
+    """Enable profiling if the `ZHAQUIRKS_PROFILING` environment variable is set."""
+    if os.environ.get(ENV_VAR, "").lower() not in ("", "0", "false", "no", "off"):
+        enable()
+
+
+def disable() -> None:
+    """Stop profiling and restore the original methods, keeping the statistics."""
+    for (cluster_type, name), func in _originals.items():
+        setattr(cluster_type, name, func)
+    _originals.clear()
+
+
+def reset() -> None:
+    """Clear the collected statistics."""
+    _stats.clear()
+
+
+def snapshot() -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+    """Return the statistics as `{quirk: {cluster: {method: stats}}}`.
+
+    Stats hold the call `count`, `total_us` and `max_us` latencies and a
+    `histogram` mapping the upper bound of each non empty latency bucket in
+    microseconds to its number of calls, the last bucket being unbounded.
+    """
+    result: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+    for (quirk, cluster, name), (count, total, maximum, buckets) in _stats.items():
+        histogram = {
+            (1 << index if index < HISTOGRAM_BUCKETS - 1 else float("inf")): calls
+            for index, calls in enumerate(buckets)
+            if calls
+        }
+        result.setdefault(quirk, {}).setdefault(cluster, {})[name] = {
+            "count": count,
+            "total_us": total / 1000,
+            "max_us": maximum / 1000,
+            "histogram": histogram,
+        }
+    return result
+
+
+def _iter_cluster_types(cluster_type: type) -> Iterator[type]:
+    for subclass in cluster_type.__subclasses__():
+        yield subclass
+        yield from _iter_cluster_types(subclass)
+
+
+def _record(cluster: CustomCluster, name: str, elapsed: int) -> None:
+    try:
+        quirk_type = type(cluster.endpoint.device)
+        quirk = f"{quirk_type.__module__}.{quirk_type.__qualname__}"
+    except AttributeError:
+        quirk = "unknown"
+    cluster_type = type(cluster)
+    key = (quirk, f"{cluster_type.__module__}.{cluster_type.__qualname__}", name)
+
+    stats = _stats.get(key)
+    if stats is None:
+        stats = _stats[key] = [0, 0, 0, [0] * HISTOGRAM_BUCKETS]
+    stats[0] += 1
+    stats[1] += elapsed
+    stats[2] = max(stats[2], elapsed)
+    stats[3][min((elapsed // 1000).bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+
+def _wrap(func: Callable, name: str) -> Callable:
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            key = (id(self), name)
+            active = _active.get()
+            if key in active:
+                return await func(self, *args, **kwargs)
+            token = _active.set(active | {key})
+            start = time.perf_counter_ns()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                _active.reset(token)
+                _record(self, name, time.perf_counter_ns() - start)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (id(self), name)
+        active = _active.get()
+        if key in active:
+            return func(self, *args, **kwargs)
+        token = _active.set(active | {key})
+        start = time.perf_counter_ns()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _active.reset(token)
+            _record(self, name, time.perf_counter_ns() - start)
+
+    return wrapper
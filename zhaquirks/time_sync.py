@@ -0,0 +1,150 @@
+"""Shared time keeping for devices that need to be fed the time.
+
+Some devices request the time, e.g. Tuya MCUs, others never do and drift until
+the time is written to them again, e.g. Danfoss Ally. `service` computes the
+current UTC and local time once per second for all of them. It also periodically
+calls the registered `write_time` coroutines, staggered over the sync interval,
+so that many devices don't all get written at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import calendar
+from collections.abc import Awaitable, Callable
+import functools
+import heapq
+import itertools
+import logging
+import time
+from typing import Any
+import weakref
+import zlib
+
+import zigpy.exceptions
+
+_LOGGER = logging.getLogger(__name__)
+
+SYNC_INTERVAL_S = 6 * 60 * 60
+
+
+@functools.cache
+def epoch_offset(year: int) -> int:
+    """Return the seconds between 1970 and January 1st of `year`."""
+    return calendar.timegm((year, 1, 1, 0, 0, 0))
+
+
+class TimeSync:
+    """Cached clock and staggered periodic time writes."""
+
+    def __init__(self, interval_s: float = SYNC_INTERVAL_S):
+        """Init."""
+        self.interval_s = interval_s
+        self._now = (-1, 0)
+        self._tuya_payloads: dict[tuple[int, int, int], bytes] = {}
+        # key -> (due loop time, write_time) of the scheduled writes
+        self._writes: dict[Any, tuple[float, weakref.WeakMethod]] = {}
+        self._queue: list[tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def now(self) -> tuple[int, int]:
+        """Return the current UTC and local time in seconds since 1970."""
+        second = int(time.time())
+        if second != self._now[0]:
+            self._now = (second, second + time.localtime(second).tm_gmtoff)
+            self._tuya_payloads.clear()
+        return self._now
+
+    def seconds_since(self, year: int, local: bool = False) -> int:
+        """Return the UTC or local time in seconds since January 1st of `year`."""
+        utc, local_time = self.now()
+        return (local_time if local else utc) - epoch_offset(year)
+
+    def utc_offset(self) -> int:
+        """Return the current offset of the local time to UTC, including DST."""
+        utc, local_time = self.now()
+        return local_time - utc
+
+    def tuya_payload(self, year: int, local_year: int | None = None) -> bytes:
+        """Return the big-endian UTC and local time, as sent to Tuya devices."""
+        utc, local_time = self.now()
+        local_year = local_year or year
+        key = (utc, year, local_year)
+        payload = self._tuya_payloads.get(key)
+        if payload is None:
+            utc_bytes = (utc - epoch_offset(year)).to_bytes(4, "big")
+            local_bytes = (local_time - epoch_offset(local_year)).to_bytes(4, "big")
+            payload = self._tuya_payloads[key] = utc_bytes + local_bytes
+        return payload
+
+    def schedule(self, key: Any, write_time: Callable[[], Awaitable]) -> None:
+        """Call `write_time` every `interval_s` at a phase derived from `key`.
+
+        Only a weak reference to the method is kept, the write is dropped once
+        its object is gone. Scheduling a key again replaces its write.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop is not self._loop:
+            self.cancel_all()
+            self._loop = loop
+
+        phase = zlib.crc32(repr(key).encode()) / 2**32 * self.interval_s
+        self._push(key, loop.time() + phase, weakref.WeakMethod(write_time))
+
+    def cancel(self, key: Any) -> None:
+        """Stop the periodic writes of `key`."""
+        self._writes.pop(key, None)
+
+    def cancel_all(self) -> None:
+        """Stop all periodic writes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._writes.clear()
+        self._queue.clear()
+
+    def _push(self, key: Any, due: float, write_time: weakref.WeakMethod) -> None:
+        self._writes[key] = (due, write_time)
+        heapq.heappush(self._queue, (due, next(self._counter), key))
+        if self._queue[0][0] == due:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = self._loop.call_at(due, self._run_due)
+
+    def _run_due(self) -> None:
+        self._timer = None
+        now = self._loop.time()
+        while self._queue and self._queue[0][0] <= now:
+            due, _, key = heapq.heappop(self._queue)
+            scheduled = self._writes.get(key)
+            if scheduled is None or scheduled[0] != due:
+                continue
+            write_time = scheduled[1]()
+            if write_time is None:
+                del self._writes[key]
+                continue
+            task = self._loop.create_task(self._write(key, write_time))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            self._writes[key] = (due + self.interval_s, scheduled[1])
+            heapq.heappush(
+                self._queue, (due + self.interval_s, next(self._counter), key)
+            )
+
+        if self._queue:
+            self._timer = self._loop.call_at(self._queue[0][0], self._run_due)
+
+    async def _write(self, key: Any, write_time: Callable[[], Awaitable]) -> None:
+        try:
+            await write_time()
+        except (TimeoutError, zigpy.exceptions.ZigbeeException) as exc:
+            _LOGGER.debug("Failed to write the time of %s: %s", key, exc)
+
+
+service = TimeSync()
@@ -1,12 +1,14 @@
 """Tuya devices."""
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 import dataclasses
-import datetime
 import enum
+import functools
 import logging
 from typing import Any, Optional, Union
 
+import zigpy.exceptions
 from zigpy.quirks import BaseCustomDevice, CustomCluster, CustomDevice
 import zigpy.types as t
 from zigpy.zcl import BaseAttributeDefs, foundation
@@ -16,7 +18,7 @@ from zigpy.zcl.clusters.homeautomation import ElectricalMeasurement
 from zigpy.zcl.clusters.hvac import Thermostat, UserInterface
 from zigpy.zcl.clusters.smartenergy import Metering
 
-from zhaquirks import Bus, EventableCluster, LocalDataCluster
+from zhaquirks import Bus, EventableCluster, LocalDataCluster, message_rates, time_sync
 from zhaquirks.const import (
     DOUBLE_PRESS,
     LEFT,
@@ -26,6 +28,7 @@ from zhaquirks.const import (
     ZHA_SEND_EVENT,
     BatterySize,
 )
+from zhaquirks.tuya import capture, snapshots
 
 # ---------------------------------------------------------
 # Tuya Custom Cluster ID
@@ -231,47 +234,55 @@ class TuyaData(t.Struct):
         self.payload = value
 
 
-class Data(t.List, item_type=t.uint8_t):
-    """list of uint8_t."""
+class Data(bytes):
+    """Tuya data payload: a length byte followed by a big-endian value."""
 
-    def __init__(self, value=None):
+    def __new__(cls, value=None):
         """Convert from a zigpy typed value to a tuya data payload."""
         if value is None:
-            super().__init__()
-            return
-        if type(value) is list or type(value) is bytes:  # noqa: E721
-            super().__init__(value)
-            return
-        # serialized in little-endian by zigpy
-        super().__init__(value.serialize())
-        # we want big-endian, with length prepended
-        self.append(len(self))
-        self.reverse()
+            return super().__new__(cls)
+        if type(value) is list or isinstance(value, bytes):  # noqa: E721
+            return super().__new__(cls, value)
+        # serialized in little-endian by zigpy, we want big-endian with length
+        raw = value.serialize()
+        return super().__new__(cls, len(raw).to_bytes(1, "big") + raw[::-1])
 
     def __int__(self):
         """Convert from a tuya data payload to an int typed value."""
-        # first uint8_t is the length of the remaining data
-        # tuya data is in big endian whereas ztypes use little endian
-        ints = {
-            1: t.int8s,
-            2: t.int16s,
-            3: t.int24s,
-            4: t.int32s,
-            5: t.int40s,
-            6: t.int48s,
-            7: t.int56s,
-            8: t.int64s,
-        }
-        return ints[self[0]].deserialize(bytes(reversed(self[1:])))[0]
+        # first byte is the length of the remaining data
+        length = self[0]
+        if not 0 < length <= 8:
+            raise ValueError(f"Invalid tuya data length: {length}")
+        return int.from_bytes(self[-length:], "big", signed=True)
 
     def __iter__(self):
         """Convert from a tuya data payload to a list typed value."""
-        return iter(reversed(self[1:]))
+        return iter(self[:0:-1])
+
+    def __eq__(self, other):
+        """Compare the raw payload, lists compare item by item."""
+        if isinstance(other, list):
+            return list(memoryview(self)) == other
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        """Compare the raw payload, lists compare item by item."""
+        return not self == other
+
+    __hash__ = bytes.__hash__
+
+    def __repr__(self) -> str:
+        """Represent the payload as its list of bytes."""
+        return repr(list(memoryview(self)))
 
     def serialize(self) -> bytes:
-        """Overload serialize to avoid prior implicit conversion to list."""
-        assert self._item_type is not None
-        return b"".join([self._item_type(i).serialize() for i in self[:]])
+        """Serialize the raw payload."""
+        return bytes(self)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> tuple["Data", bytes]:
+        """Deserialize the remaining data as the payload."""
+        return cls(data), b""
 
 
 class TuyaDatapointData(t.Struct):
@@ -397,6 +408,12 @@ class TuyaManufCluster(CustomCluster):
         self.endpoint.device.command_bus = Bus()
         self.endpoint.device.command_bus.add_listener(self)  # listen MCU commands
 
+    def deserialize(self, data: bytes) -> tuple[foundation.ZCLHeader, Any]:
+        """Deserialize a frame, appending it to the capture trace if enabled."""
+        hdr, args = super().deserialize(data)
+        capture.record(self, hdr.command_id, data)
+        return hdr, args
+
     def tuya_mcu_command(self, command: Command):
         """Tuya MCU command listener. Only endpoint:1 must listen to MCU commands."""
 
@@ -431,23 +448,11 @@ class TuyaManufCluster(CustomCluster):
             self.cluster_id,
             hdr.command_id,
         )
-        payload = TuyaTimePayload()
-        utc_timestamp = int(
-            (
-                datetime.datetime.utcnow()  # noqa: DTZ003
-                - datetime.datetime(self.set_time_offset, 1, 1)
-            ).total_seconds()
-        )
-        local_timestamp = int(
-            (
-                datetime.datetime.now()
-                - datetime.datetime(
-                    self.set_time_local_offset or self.set_time_offset, 1, 1
-                )
-            ).total_seconds()
+        payload = TuyaTimePayload(
+            time_sync.service.tuya_payload(
+                self.set_time_offset, self.set_time_local_offset
+            )
         )
-        payload.extend(utc_timestamp.to_bytes(4, "big", signed=False))
-        payload.extend(local_timestamp.to_bytes(4, "big", signed=False))
 
         self.create_catching_task(
             super().command(TUYA_SET_TIME, payload, expect_reply=False)
@@ -457,6 +462,9 @@ class TuyaManufCluster(CustomCluster):
 class TuyaManufClusterAttributes(TuyaManufCluster):
     """Manufacturer specific cluster for Tuya converting attributes <-> commands."""
 
+    # maximum number of set_data commands in flight while writing attributes
+    write_window: int = 4
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -507,27 +515,62 @@ class TuyaManufClusterAttributes(TuyaManufCluster):
         )
 
     async def write_attributes(self, attributes, manufacturer=None):
-        """Defer attributes writing to the set_data tuya command."""
+        """Defer attributes writing to the set_data tuya command.
 
-        records = self._write_attr_records(attributes)
+        The set_data commands of all records are pipelined, with at most
+        `write_window` of them in flight, and their statuses aggregated.
+        """
 
-        for record in records:
-            cmd_payload = TuyaManufCluster.Command()
-            cmd_payload.status = 0
-            cmd_payload.tsn = self.endpoint.device.application.get_sequence()
-            cmd_payload.command_id = record.attrid
-            cmd_payload.function = 0
-            cmd_payload.data = record.value.value
+        records = self._write_attr_records(attributes)
+        window = asyncio.Semaphore(self.write_window)
+        statuses = await asyncio.gather(
+            *(self._set_data(record, window, manufacturer) for record in records)
+        )
 
-            await super().command(
-                TUYA_SET_DATA,
-                cmd_payload,
-                manufacturer=manufacturer,
-                expect_reply=False,
-                tsn=cmd_payload.tsn,
-            )
+        failed = [
+            foundation.WriteAttributesStatusRecord(status, record.attrid)
+            for record, status in zip(records, statuses, strict=True)
+            if status != foundation.Status.SUCCESS
+        ]
+        return [
+            failed
+            or [foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]
+        ]
 
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+    async def _set_data(
+        self,
+        record: foundation.Attribute,
+        window: asyncio.Semaphore,
+        manufacturer: Optional[int] = None,
+    ) -> foundation.Status:
+        """Send the set_data command of a record once the window allows it."""
+        cmd_payload = TuyaManufCluster.Command()
+        cmd_payload.status = 0
+        cmd_payload.tsn = self.endpoint.device.application.get_sequence()
+        cmd_payload.command_id = record.attrid
+        cmd_payload.function = 0
+        cmd_payload.data = record.value.value
+
+        async with window:
+            try:
+                await super().command(
+                    TUYA_SET_DATA,
+                    cmd_payload,
+                    manufacturer=manufacturer,
+                    expect_reply=False,
+                    tsn=cmd_payload.tsn,
+                )
+            except (TimeoutError, zigpy.exceptions.ZigbeeException) as exc:
+                _LOGGER.debug(
+                    "[0x%04x:%s:0x%04x] Failed to write attribute 0x%04x: %r",
+                    self.endpoint.device.nwk,
+                    self.endpoint.endpoint_id,
+                    self.cluster_id,
+                    record.attrid,
+                    exc,
+                )
+                return foundation.Status.FAILURE
+        return foundation.Status.SUCCESS
 
 
 class BaseEnchantedDevice(BaseCustomDevice):
@@ -575,13 +618,67 @@ class EnchantedDevice(CustomDevice, BaseEnchantedDevice):
     """Enchanted device class for v1 quirks."""
 
 
+class TuyaSwitchBus(Bus):
+    """Switch bus delivering switch events to the clusters of their channel.
+
+    Listeners added with `add_channel_listener` only get `switch_event` calls for
+    their own channel, other listeners get all switch events.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._channel_handlers: dict[int, list[Callable]] = {}
+
+    def add_channel_listener(self, channel: int, listener: Any) -> None:
+        """Add a listener for the switch events of a single channel."""
+        self._channel_handlers.setdefault(channel, []).append(listener.switch_event)
+
+    def remove_listener(self, listener: Any) -> None:
+        """Remove a listener."""
+        for channel, handlers in self._channel_handlers.items():
+            self._channel_handlers[channel] = [
+                handler for handler in handlers if handler.__self__ is not listener
+            ]
+        super().remove_listener(listener)
+
+    def listener_event(self, method_name: str, *args) -> list[Any]:
+        """Call `method_name` on all listeners and return their results."""
+        if method_name != SWITCH_EVENT:
+            return super().listener_event(method_name, *args)
+        result: list[Any] = []
+        for handler in self._switch_handlers(args[0]):
+            self._call_handler(handler, args, result)
+        return result
+
+    def emitter(self, method_name: str) -> Callable[..., None]:
+        """Return a function calling `method_name` on all listeners."""
+        if method_name != SWITCH_EVENT:
+            return super().emitter(method_name)
+
+        def emit(channel: int, state: Any) -> None:
+            args = (channel, state)
+            for handler in self._switch_handlers(channel):
+                self._call_handler(handler, args)
+
+        return emit
+
+    def _switch_handlers(self, channel: int) -> tuple[Callable, ...]:
+        """Return the handlers of a switch event, other listeners first."""
+        return (*self.handlers(SWITCH_EVENT), *self._channel_handlers.get(channel, ()))
+
+
 class TuyaOnOff(CustomCluster, OnOff):
     """Tuya On/Off cluster for On/Off device."""
 
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
-        self.endpoint.device.switch_bus.add_listener(self)
+        switch_bus = self.endpoint.device.switch_bus
+        if isinstance(switch_bus, TuyaSwitchBus):
+            switch_bus.add_channel_listener(self.endpoint.endpoint_id, self)
+        else:
+            switch_bus.add_listener(self)
 
     def switch_event(self, channel, state):
         """Switch event."""
@@ -665,7 +762,7 @@ class TuyaSwitch(CustomDevice):
 
     def __init__(self, *args, **kwargs):
         """Init device."""
-        self.switch_bus = Bus()
+        self.switch_bus = TuyaSwitchBus()
         super().__init__(*args, **kwargs)
 
 
@@ -678,6 +775,23 @@ class TuyaDimmerSwitch(TuyaSwitch):
         super().__init__(*args, **kwargs)
 
 
+def _map_write_result(result: list, sources: dict[int, list[int]]) -> list:
+    """Map the result of a manufacturer attributes write to the written attributes.
+
+    `sources` maps each manufacturer attribute to the attributes it was mapped from.
+    """
+    records = result[0] if result and isinstance(result[0], list) else []
+    failed = [
+        foundation.WriteAttributesStatusRecord(record.status, attrid)
+        for record in records
+        if record.status != foundation.Status.SUCCESS
+        for attrid in sources.get(record.attrid, ())
+    ]
+    return [
+        failed or [foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]
+    ]
+
+
 class TuyaThermostatCluster(LocalDataCluster, Thermostat):
     """Thermostat cluster for Tuya thermostats."""
 
@@ -716,7 +830,31 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
         if not records:
             return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
 
+        manufacturer_attrs, sources = self._map_write_records(records)
+        if not manufacturer_attrs:
+            return [
+                [
+                    foundation.WriteAttributesStatusRecord(
+                        foundation.Status.FAILURE, r.attrid
+                    )
+                    for r in records
+                ]
+            ]
+
+        result = await self.endpoint.tuya_manufacturer.write_attributes(
+            manufacturer_attrs, manufacturer=manufacturer
+        )
+        return _map_write_result(result, sources)
+
+    def _map_write_records(self, records):
+        """Map written records to manufacturer attribute values.
+
+        Also returns, per manufacturer attribute, the ids of the written
+        attributes mapped to it.
+        """
+
         manufacturer_attrs = {}
+        sources = {}
         for record in records:
             attr_name = self.attributes[record.attrid].name
             new_attrs = self.map_attribute(attr_name, record.value.value)
@@ -734,22 +872,10 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
             )
 
             manufacturer_attrs.update(new_attrs)
+            for attrid in new_attrs:
+                sources.setdefault(attrid, []).append(record.attrid)
 
-        if not manufacturer_attrs:
-            return [
-                [
-                    foundation.WriteAttributesStatusRecord(
-                        foundation.Status.FAILURE, r.attrid
-                    )
-                    for r in records
-                ]
-            ]
-
-        await self.endpoint.tuya_manufacturer.write_attributes(
-            manufacturer_attrs, manufacturer=manufacturer
-        )
-
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+        return manufacturer_attrs, sources
 
     # pylint: disable=W0236
     async def command(
@@ -822,6 +948,7 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
         records = self._write_attr_records(attributes)
 
         manufacturer_attrs = {}
+        sources = {}
         for record in records:
             if record.attrid == self.attributes_by_name["keypad_lockout"].id:
                 lock = 0 if record.value.value == self.KeypadLockout.No_lockout else 1
@@ -843,6 +970,8 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
                 )
 
             manufacturer_attrs.update(new_attrs)
+            for attrid in new_attrs:
+                sources.setdefault(attrid, []).append(record.attrid)
 
         if not manufacturer_attrs:
             return [
@@ -854,11 +983,10 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
                 ]
             ]
 
-        await self.endpoint.tuya_manufacturer.write_attributes(
+        result = await self.endpoint.tuya_manufacturer.write_attributes(
             manufacturer_attrs, manufacturer=manufacturer
         )
-
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+        return _map_write_result(result, sources)
 
 
 class TuyaLocalCluster(LocalDataCluster):
@@ -1142,10 +1270,88 @@ class TuyaZB1888Cluster(CustomCluster):
     ep_attribute = "tuya_manufacturer_specific_6280"
 
 
+class TuyaCommandCoalescer:
+    """Coalesce a stream of commands, keeping only the latest one.
+
+    Commands are sent after a short window. A command sent within the window or
+    while the previous command is still in flight supersedes it: the previous
+    command is cancelled and returns a success default response, so the last
+    command is always delivered.
+    """
+
+    def __init__(self, window_s: float):
+        """Init."""
+        self.window_s = window_s
+        self._task: asyncio.Task | None = None
+
+    def cancel(self) -> None:
+        """Cancel the pending command, if any."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def send(self, command_id: int, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send a command built by `send` unless a newer command supersedes it."""
+        self.cancel()
+        task = self._task = asyncio.get_running_loop().create_task(
+            self._send_later(send)
+        )
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current_task = asyncio.current_task()
+            if not task.cancelled() or (current_task and current_task.cancelling()):
+                raise
+        _LOGGER.debug("Command 0x%02x superseded by a newer one", command_id)
+        return foundation.GENERAL_COMMANDS[
+            foundation.GeneralCommand.Default_Response
+        ].schema(command_id=command_id, status=foundation.Status.SUCCESS)
+
+    async def _send_later(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        await asyncio.sleep(self.window_s)
+        return await send()
+
+
+class TuyaCoalescingMixin:
+    """A mixin coalescing the set data commands of a cluster, when enabled.
+
+    Quirks opt in by setting `coalesce_window_s` on the cluster.
+    """
+
+    # coalesce commands sent within this window, 0 to disable
+    coalesce_window_s: float = 0
+
+    _coalescer: TuyaCommandCoalescer | None = None
+
+    def _coalesced_command(self, command_id: int, payload: TuyaManufCluster.Command):
+        """Send a Tuya set data command through the coalescer of the cluster."""
+        if (
+            self._coalescer is None
+            or self._coalescer.window_s != self.coalesce_window_s
+        ):
+            self._coalescer = TuyaCommandCoalescer(self.coalesce_window_s)
+        return self._coalescer.send(
+            command_id,
+            functools.partial(
+                self.endpoint.tuya_manufacturer.command,
+                TUYA_SET_DATA,
+                payload,
+                expect_reply=True,
+            ),
+        )
+
+
 # Tuya Window Cover Implementation
 class TuyaManufacturerWindowCover(TuyaManufCluster):
     """Manufacturer Specific Cluster for cover device."""
 
+    # Tuya command id -> (cover attribute, index of its value in the data)
+    cover_datapoints: dict[int, tuple[int, int]] = {
+        TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE: (ATTR_COVER_POSITION, 4),
+        TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL: (ATTR_COVER_POSITION, 4),
+        TUYA_DP_TYPE_ENUM + TUYA_DP_ID_DIRECTION_CHANGE: (ATTR_COVER_DIRECTION, 1),
+        TUYA_DP_TYPE_ENUM + TUYA_DP_ID_COVER_INVERTED: (ATTR_COVER_INVERTED, 1),
+    }
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -1159,44 +1365,24 @@ class TuyaManufacturerWindowCover(TuyaManufCluster):
         # Tuya Specific Cluster Commands
         if hdr.command_id in (TUYA_GET_DATA, TUYA_SET_DATA_RESPONSE):
             tuya_payload = args[0]
-            _LOGGER.debug(
-                "%s Received Attribute Report. Command is 0x%04x, Tuya Paylod values"
-                "[Status : %s, TSN: %s, Command: 0x%04x, Function: 0x%02x, Data: %s]",
-                self.endpoint.device.ieee,
-                hdr.command_id,
-                tuya_payload.status,
-                tuya_payload.tsn,
-                tuya_payload.command_id,
-                tuya_payload.function,
-                tuya_payload.data,
-            )
-
-            ids = [
-                TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE,
-                TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL,
-            ]
-            if tuya_payload.command_id in ids:
-                self.endpoint.device.cover_bus.listener_event(
-                    COVER_EVENT,
-                    ATTR_COVER_POSITION,
-                    tuya_payload.data[4],
-                )
-            elif (
-                tuya_payload.command_id
-                == TUYA_DP_TYPE_ENUM + TUYA_DP_ID_DIRECTION_CHANGE
-            ):
-                self.endpoint.device.cover_bus.listener_event(
-                    COVER_EVENT,
-                    ATTR_COVER_DIRECTION,
-                    tuya_payload.data[1],
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s Received Attribute Report. Command is 0x%04x, Tuya Paylod values"
+                    "[Status : %s, TSN: %s, Command: 0x%04x, Function: 0x%02x, Data: %s]",
+                    self.endpoint.device.ieee,
+                    hdr.command_id,
+                    tuya_payload.status,
+                    tuya_payload.tsn,
+                    tuya_payload.command_id,
+                    tuya_payload.function,
+                    tuya_payload.data,
                 )
-            elif (
-                tuya_payload.command_id == TUYA_DP_TYPE_ENUM + TUYA_DP_ID_COVER_INVERTED
-            ):
+
+            datapoint = self.cover_datapoints.get(tuya_payload.command_id)
+            if datapoint is not None:
+                attribute, index = datapoint
                 self.endpoint.device.cover_bus.listener_event(
-                    COVER_EVENT,
-                    ATTR_COVER_INVERTED,
-                    tuya_payload.data[1],  # Check this
+                    COVER_EVENT, attribute, tuya_payload.data[index]
                 )
         elif hdr.command_id == TUYA_SET_TIME:
             """Time event call super"""
@@ -1211,7 +1397,7 @@ class TuyaManufacturerWindowCover(TuyaManufCluster):
             )
 
 
-class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
+class TuyaWindowCoverControl(TuyaCoalescingMixin, LocalDataCluster, WindowCovering):
     """Manufacturer Specific Cluster of Device cover."""
 
     # Add additional attributes for direction
@@ -1224,16 +1410,18 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
         super().__init__(*args, **kwargs)
         self.endpoint.device.cover_bus.add_listener(self)
 
+    @property
+    def _invert_position(self) -> bool:
+        """Return whether positions are exchanged with the device as is."""
+        # cover_inverted flips the default inversion of the quirk
+        return (
+            self._attr_cache.get(ATTR_COVER_INVERTED) == 1
+        ) != self.endpoint.device.tuya_cover_inverted_by_default
+
     def cover_event(self, attribute, value):
         """Event listener for cover events."""
-        if attribute == ATTR_COVER_POSITION:
-            invert_attr = self._attr_cache.get(ATTR_COVER_INVERTED) == 1
-            invert = (
-                not invert_attr
-                if self.endpoint.device.tuya_cover_inverted_by_default
-                else invert_attr
-            )
-            value = value if invert else 100 - value
+        if attribute == ATTR_COVER_POSITION and not self._invert_position:
+            value = 100 - value
         self._update_attribute(attribute, value)
         _LOGGER.debug(
             "%s Tuya Attribute Cache : [%s]",
@@ -1266,6 +1454,9 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
             WINDOW_COVER_COMMAND_DOWNCLOSE,
             WINDOW_COVER_COMMAND_STOP,
         ):
+            # these commands supersede a pending position
+            if self._coalescer is not None:
+                self._coalescer.cancel()
             tuya_payload.status = 0
             tuya_payload.tsn = tsn if tsn else 0
             tuya_payload.command_id = TUYA_DP_TYPE_ENUM + TUYA_DP_ID_CONTROL
@@ -1282,13 +1473,7 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
             tuya_payload.command_id = TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL
             tuya_payload.function = 0
             """Check direction and correct value"""
-            invert_attr = self._attr_cache.get(ATTR_COVER_INVERTED) == 1
-            invert = (
-                not invert_attr
-                if self.endpoint.device.tuya_cover_inverted_by_default
-                else invert_attr
-            )
-            position = args[0] if invert else 100 - args[0]
+            position = args[0] if self._invert_position else 100 - args[0]
             tuya_payload.data = [
                 4,
                 0,
@@ -1319,6 +1504,11 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
                 tuya_payload.data,
             )
 
+            if (
+                command_id == WINDOW_COVER_COMMAND_LIFTPERCENT
+                and self.coalesce_window_s
+            ):
+                return self._coalesced_command(command_id, tuya_payload)
             return self.endpoint.tuya_manufacturer.command(
                 TUYA_SET_DATA, tuya_payload, expect_reply=True
             )
@@ -1386,7 +1576,7 @@ class TuyaManufacturerLevelControl(TuyaManufCluster):
                 )
 
 
-class TuyaLevelControl(CustomCluster, LevelControl):
+class TuyaLevelControl(TuyaCoalescingMixin, CustomCluster, LevelControl):
     """Tuya Level cluster for dimmable device."""
 
     def __init__(self, *args, **kwargs):
@@ -1443,6 +1633,8 @@ class TuyaLevelControl(CustomCluster, LevelControl):
             val2 = brightness & 0xFF
             cmd_payload.data = [4, 0, 0, val1, val2]  # Custom Command
 
+            if self.coalesce_window_s:
+                return self._coalesced_command(command_id, cmd_payload)
             return self.endpoint.tuya_manufacturer.command(
                 TUYA_SET_DATA, cmd_payload, expect_reply=True
             )
@@ -1557,6 +1749,19 @@ class TuyaNewManufCluster(CustomCluster):
                     cluster._VALID_ATTRIBUTES = set()
                 cluster._VALID_ATTRIBUTES.add(attr.id)
 
+        if snapshots.store is not None:
+            # other endpoints of the device may not exist yet
+            try:
+                asyncio.get_running_loop().call_soon(self._replay_snapshot)
+            except RuntimeError:
+                self._replay_snapshot()
+
+    def deserialize(self, data: bytes) -> tuple[foundation.ZCLHeader, Any]:
+        """Deserialize a frame, appending it to the capture trace if enabled."""
+        hdr, args = super().deserialize(data)
+        capture.record(self, hdr.command_id, data)
+        return hdr, args
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -1568,6 +1773,7 @@ class TuyaNewManufCluster(CustomCluster):
     ) -> None:
         """Handle cluster specific request."""
 
+        message_rates.record(self, message_rates.FRAMES)
         try:
             if hdr.direction == foundation.Direction.Server_to_Client:
                 # server_cluster -> client_cluster cluster specific command
@@ -1599,7 +1805,9 @@ class TuyaNewManufCluster(CustomCluster):
 
     def handle_get_data(self, command: TuyaCommand) -> foundation.Status:
         """Handle get_data response (report)."""
+        message_rates.record(self, message_rates.VALUES, len(command.datapoints))
         dp_error = False
+        snapshot = snapshots.store is not None
         for record in command.datapoints:
             try:
                 dp_handler = self.data_point_handlers[record.dp]
@@ -1608,6 +1816,9 @@ class TuyaNewManufCluster(CustomCluster):
                 self.debug("No datapoint handler for %s", record)
                 dp_error = True
                 # return foundation.Status.UNSUPPORTED_ATTRIBUTE
+                continue
+            if snapshot and record.dp in self.dp_to_attribute:
+                snapshots.record(self, record)
 
         return (
             foundation.Status.SUCCESS
@@ -1622,6 +1833,19 @@ class TuyaNewManufCluster(CustomCluster):
         """Handle Time set request."""
         return foundation.Status.SUCCESS
 
+    def _replay_snapshot(self) -> None:
+        """Restore the mapped attributes from the persisted datapoint snapshot."""
+        for data in snapshots.datapoints(self):
+            self._replay_datapoint(data)
+
+    def _replay_datapoint(self, data: bytes) -> None:
+        try:
+            datapoint, _ = TuyaDatapointData.deserialize(data)
+            if datapoint.dp in self.dp_to_attribute:
+                self._dp_2_attr_update(datapoint)
+        except (KeyError, AttributeError, ValueError, TypeError) as exc:
+            self.debug("Failed to replay snapshot datapoint %r: %s", data, exc)
+
     def _dp_2_attr_update(self, datapoint: TuyaDatapointData) -> None:
         """Handle data point to attribute report conversion."""
         try:
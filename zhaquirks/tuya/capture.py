@@ -0,0 +1,200 @@
+"""Optional capture of inbound Tuya frames to a compact binary trace.
+
+When capturing, every frame deserialized by the Tuya manufacturer clusters is
+appended to a trace file together with the time it was received, the device and
+quirk it was received by, the endpoint, the cluster and the command id. Traces can
+be replayed through the quirks without a radio, e.g. with
+``python -m tests.benchmarks.replay_tuya_trace <trace>``.
+
+Capturing is started by `start()` or by setting the `ZHAQUIRKS_TUYA_CAPTURE`
+environment variable to the trace path before `zhaquirks.setup()` runs.
+
+The trace starts with `MAGIC` and the capture start time, followed by records:
+
+- device: tag 1, IEEE address, length and dotted path of the quirk class
+- frame: tag 2, milliseconds since start, device index in order of the device
+  records, endpoint id, cluster id, command id, length and the raw ZCL frame
+- start: tag 3, new start time of the following frames, written when the
+  milliseconds since start no longer fit into their field
+
+Capturing stops on the first error, e.g. a full disk, without affecting the
+decoding of the frame.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+import dataclasses
+import logging
+import os
+import struct
+import time
+from typing import Any, BinaryIO
+
+import zigpy.types as t
+
+_LOGGER = logging.getLogger(__name__)
+
+ENV_VAR = "ZHAQUIRKS_TUYA_CAPTURE"
+MAGIC = b"ZQTC\x01"
+DEVICE_RECORD = 1
+FRAME_RECORD = 2
+START_RECORD = 3
+
+_START = struct.Struct("<d")
+_RESTART = struct.Struct("<Bd")
+_DEVICE = struct.Struct("<B8sH")
+_FRAME = struct.Struct("<BIHBHBH")
+
+
+@dataclasses.dataclass(frozen=True)
+class TraceDevice:
+    """Device of a captured trace."""
+
+    ieee: t.EUI64
+    quirk: str
+
+
+@dataclasses.dataclass(frozen=True)
+class TraceFrame:
+    """Frame of a captured trace."""
+
+    timestamp: float
+    device: TraceDevice
+    endpoint_id: int
+    cluster_id: int
+    command_id: int
+    data: bytes
+
+
+class TraceRecorder:
+    """Appends inbound frames to a trace file."""
+
+    def __init__(self, path: str):
+        """Init."""
+        self.path = path
+        self.frames = 0
+        # frame times are measured on the monotonic clock from the start time
+        self._start = time.monotonic()
+        self._devices: dict[t.EUI64, int] = {}
+        self._file: BinaryIO = open(path, "wb")  # noqa: SIM115
+        self._file.write(MAGIC + _START.pack(time.time()))
+
+    def record(self, cluster: Any, command_id: int, data: bytes) -> None:
+        """Append a frame deserialized by a cluster."""
+        device = cluster.endpoint.device
+        index = self._devices.get(device.ieee)
+        if index is None:
+            index = self._devices[device.ieee] = len(self._devices)
+            quirk = f"{type(device).__module__}.{type(device).__qualname__}"
+            quirk_bytes = quirk.encode()
+            self._file.write(
+                _DEVICE.pack(DEVICE_RECORD, device.ieee.serialize(), len(quirk_bytes))
+                + quirk_bytes
+            )
+
+        millis = int((time.monotonic() - self._start) * 1000)
+        if millis > 0xFFFFFFFF:
+            self._start = time.monotonic()
+            self._file.write(_RESTART.pack(START_RECORD, time.time()))
+            millis = 0
+
+        self._file.write(
+            _FRAME.pack(
+                FRAME_RECORD,
+                millis,
+                index,
+                cluster.endpoint.endpoint_id,
+                cluster.cluster_id,
+                command_id,
+                len(data),
+            )
+            + data
+        )
+        self.frames += 1
+
+    def close(self) -> None:
+        """Close the trace file."""
+        self._file.close()
+        _LOGGER.debug("Captured %d Tuya frames to %s", self.frames, self.path)
+
+
+def read_trace(path: str) -> Iterator[TraceFrame]:
+    """Return the frames of a trace file."""
+    with open(path, "rb") as trace:
+        data = trace.read()
+
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a Tuya frame trace")
+    offset = len(MAGIC)
+    (start,) = _START.unpack_from(data, offset)
+    offset += _START.size
+    devices: list[TraceDevice] = []
+
+    while offset < len(data):
+        if data[offset] == DEVICE_RECORD:
+            _tag, ieee, length = _DEVICE.unpack_from(data, offset)
+            offset += _DEVICE.size
+            quirk = data[offset : offset + length].decode()
+            offset += length
+            devices.append(TraceDevice(t.EUI64.deserialize(ieee)[0], quirk))
+        elif data[offset] == FRAME_RECORD:
+            _tag, millis, index, endpoint_id, cluster_id, command_id, length = (
+                _FRAME.unpack_from(data, offset)
+            )
+            offset += _FRAME.size
+            yield TraceFrame(
+                start + millis / 1000,
+                devices[index],
+                endpoint_id,
+                cluster_id,
+                command_id,
+                data[offset : offset + length],
+            )
+            offset += length
+        elif data[offset] == START_RECORD:
+            _tag, start = _RESTART.unpack_from(data, offset)
+            offset += _RESTART.size
+        else:
+            raise ValueError(f"Invalid trace record {data[offset]} at {offset}")
+
+
+recorder: TraceRecorder | None = None
+
+
+def start(path: str) -> TraceRecorder:
+    """Start capturing inbound Tuya frames to a new trace at `path`."""
+    global recorder  # noqa: PLW0603
+    stop()
+    recorder = TraceRecorder(path)
+    return recorder
+
+
+def start_from_env() -> None:
+    """Start capturing if the `ZHAQUIRKS_TUYA_CAPTURE` environment variable is set."""
+    path = os.environ.get(ENV_VAR)
+    if path:
+        start(path)
+
+
+def stop() -> None:
+    """Stop capturing and close the trace."""
+    global recorder  # noqa: PLW0603
+    if recorder is not None:
+        recorder.close()
+    recorder = None
+
+
+def record(cluster: Any, command_id: int, data: bytes) -> None:
+    """Append a frame deserialized by a cluster, if capturing."""
+    global recorder  # noqa: PLW0603
+    if recorder is None:
+        return
+    try:
+        recorder.record(cluster, command_id, data)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Failed to capture a Tuya frame, stopping the capture")
+        failed, recorder = recorder, None
+        with contextlib.suppress(OSError):
+            failed.close()
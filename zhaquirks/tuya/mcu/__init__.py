@@ -2,14 +2,13 @@
 
 from collections.abc import Callable
 import dataclasses
-import datetime
 from typing import Any, Optional, Union
 
 import zigpy.types as t
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import LevelControl, OnOff
 
-from zhaquirks import Bus, DoublingPowerConfigurationCluster
+from zhaquirks import Bus, DoublingPowerConfigurationCluster, time_sync
 
 # add EnchantedDevice import for custom quirks backwards compatibility
 from zhaquirks.tuya import (
@@ -320,22 +319,12 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
         """Handle set_time requests (0x24)."""
 
         self.debug("handle_set_time_request payload: %s", payload)
-        payload_rsp = TuyaTimePayload()
-
-        utc_now = datetime.datetime.utcnow()  # noqa: DTZ003
-        now = datetime.datetime.now()
-
-        offset_time = datetime.datetime(self.set_time_offset, 1, 1)
-        offset_time_local = datetime.datetime(
-            self.set_time_local_offset or self.set_time_offset, 1, 1
+        payload_rsp = TuyaTimePayload(
+            time_sync.service.tuya_payload(
+                self.set_time_offset, self.set_time_local_offset
+            )
         )
 
-        utc_timestamp = int((utc_now - offset_time).total_seconds())
-        local_timestamp = int((now - offset_time_local).total_seconds())
-
-        payload_rsp.extend(utc_timestamp.to_bytes(4, "big", signed=False))
-        payload_rsp.extend(local_timestamp.to_bytes(4, "big", signed=False))
-
         self.debug("handle_set_time_request response: %s", payload_rsp)
         self.create_catching_task(
             super().command(TUYA_SET_TIME, payload_rsp, expect_reply=False)
@@ -0,0 +1,160 @@
+"""Optional persisted snapshots of Tuya datapoint values.
+
+Tuya MCU devices only report datapoints on change, so attributes mapped from
+datapoints stay unknown after a restart until the device reports again. When
+enabled, the last value of every datapoint mapped in `dp_to_attribute` is kept
+per device in an SQLite database and replayed into the mapped attributes when the
+Tuya cluster is created.
+
+Snapshots are enabled by `enable()` or by setting the `ZHAQUIRKS_TUYA_SNAPSHOTS`
+environment variable to the database path before `zhaquirks.setup()` runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import sqlite3
+import time
+from typing import Any
+
+import zigpy.types as t
+
+_LOGGER = logging.getLogger(__name__)
+
+ENV_VAR = "ZHAQUIRKS_TUYA_SNAPSHOTS"
+FLUSH_DELAY_S = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tuya_datapoints (
+    ieee TEXT NOT NULL,
+    dp INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (ieee, dp)
+)
+"""
+
+
+class DatapointSnapshots:
+    """Last reported datapoints per device, backed by an SQLite database.
+
+    Datapoints are kept as reported and only serialized when written, which
+    happens in the background at most every `flush_delay_s` seconds.
+    """
+
+    def __init__(self, path: str, flush_delay_s: float = FLUSH_DELAY_S):
+        """Init."""
+        self.path = path
+        self.flush_delay_s = flush_delay_s
+        # ieee -> dp -> (wall clock time, datapoint or its serialized bytes)
+        self._devices: dict[t.EUI64, dict[int, tuple[float, Any]]] = {}
+        self._dirty: set[tuple[t.EUI64, int]] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def load(self) -> None:
+        """Load the snapshots from the database."""
+        with contextlib.closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(_SCHEMA)
+            rows = conn.execute("SELECT ieee, dp, updated, data FROM tuya_datapoints")
+            for ieee, dp, updated, data in rows:
+                self._set(t.EUI64.convert(ieee), dp, updated, bytes(data))
+        _LOGGER.debug("Loaded datapoint snapshots of %d devices", len(self._devices))
+
+    def record(self, ieee: t.EUI64, datapoint: Any) -> None:
+        """Remember the last reported datapoint of a device."""
+        self._set(ieee, datapoint.dp, time.time(), datapoint)
+        self._dirty.add((ieee, datapoint.dp))
+        if self._flush_handle is None:
+            with contextlib.suppress(RuntimeError):
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.flush_delay_s, self._flush_later
+                )
+
+    def datapoints(self, ieee: t.EUI64) -> list[bytes]:
+        """Return the serialized datapoints of a device."""
+        return [
+            _serialize(datapoint)
+            for _updated, datapoint in self._devices.get(ieee, {}).values()
+        ]
+
+    def flush(self) -> None:
+        """Write the changed datapoints to the database."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._write(self._pop_dirty())
+
+    def _set(self, ieee: t.EUI64, dp: int, updated: float, datapoint: Any) -> None:
+        self._devices.setdefault(ieee, {})[dp] = (updated, datapoint)
+
+    def _pop_dirty(self) -> list[tuple[str, int, float, bytes]]:
+        rows = []
+        for ieee, dp in self._dirty:
+            updated, datapoint = self._devices[ieee][dp]
+            rows.append((str(ieee), dp, updated, _serialize(datapoint)))
+        self._dirty.clear()
+        return rows
+
+    def _flush_later(self) -> None:
+        self._flush_handle = None
+        rows = self._pop_dirty()
+        asyncio.get_running_loop().run_in_executor(None, self._write, rows)
+
+    def _write(self, rows: list[tuple[str, int, float, bytes]]) -> None:
+        if not rows:
+            return
+        with contextlib.closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(_SCHEMA)
+            conn.executemany(
+                "INSERT OR REPLACE INTO tuya_datapoints VALUES (?, ?, ?, ?)", rows
+            )
+        _LOGGER.debug("Wrote %d datapoint snapshots", len(rows))
+
+
+def _serialize(datapoint: Any) -> bytes:
+    return datapoint if isinstance(datapoint, bytes) else datapoint.serialize()
+
+
+store: DatapointSnapshots | None = None
+
+
+def enable(path: str, flush_delay_s: float = FLUSH_DELAY_S) -> DatapointSnapshots:
+    """Start keeping datapoint snapshots in the SQLite database at `path`."""
+    global store  # noqa: PLW0603
+    if store is None or store.path != path:
+        disable()
+        store = DatapointSnapshots(path, flush_delay_s)
+        store.load()
+    store.flush_delay_s = flush_delay_s
+    return store
+
+
+def enable_from_env() -> None:
+    """Enable snapshots if the `ZHAQUIRKS_TUYA_SNAPSHOTS` environment variable is set."""
+    path = os.environ.get(ENV_VAR)
+    if path:
+        enable(path)
+
+
+def disable() -> None:
+    """Write pending datapoints and stop keeping snapshots."""
+    global store  # noqa: PLW0603
+    if store is not None:
+        store.flush()
+    store = None
+
+
+def record(cluster: Any, datapoint: Any) -> None:
+    """Remember a datapoint reported to a cluster, if enabled."""
+    if store is not None:
+        store.record(cluster.endpoint.device.ieee, datapoint)
+
+
+def datapoints(cluster: Any) -> list[bytes]:
+    """Return the serialized snapshot datapoints of the device of a cluster."""
+    if store is None:
+        return []
+    return store.datapoints(cluster.endpoint.device.ieee)
@@ -560,50 +560,12 @@ class MoesThermostat(TuyaThermostatCluster):
                     self.attributes_by_name["operation_preset"].id, 2
                 )
             }
-        if attribute in self.WORKDAY_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WORKDAY_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                elif attr == attribute:
-                    val = value
-                else:
-                    val = self._attr_cache.get(
-                        self.attributes_by_name[attr].id, default
-                    )
-
-                data.append(val)
-            return {MOES_SCHEDULE_WORKDAY_ATTR: data}
-        if attribute in self.WEEKEND_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WEEKEND_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                elif attr == attribute:
-                    val = value
-                else:
-                    val = self._attr_cache.get(
-                        self.attributes_by_name[attr].id, default
-                    )
-
-                data.append(val)
-            return {MOES_SCHEDULE_WEEKEND_ATTR: data}
+        attrid = self.attributes_by_name[attribute].id
+        schedule_attr = self._schedule_layouts()[1].get(attrid)
+        if schedule_attr is not None:
+            return {
+                schedule_attr: self._compose_schedule(schedule_attr, {attrid: value})
+            }
 
     def mode_change(self, value):
         """System Mode change."""
@@ -634,128 +596,76 @@ class MoesThermostat(TuyaThermostatCluster):
     def schedule_change(self, attr, value):
         """Scheduler attribute change."""
 
-        if attr == MOES_SCHEDULE_WORKDAY_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_temperature"].id,
-                value[0] * 100,
-            )
-        elif attr == MOES_SCHEDULE_WEEKEND_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_temperature"].id,
-                value[0] * 100,
+        changed = {}
+        # first period first
+        for (attrid, _, scale, mask), byte in zip(
+            reversed(self._schedule_layouts()[0][attr]), reversed(value), strict=True
+        ):
+            slot_value = (byte & mask) * scale
+            if self._attr_cache.get(attrid) != slot_value:
+                changed[attrid] = slot_value
+        if changed:
+            self._update_attributes(changed)
+
+    def _map_write_records(self, records):
+        """Map written records, with one frame per changed schedule."""
+
+        schedule_blocks = self._schedule_layouts()[1]
+        other_records = []
+        schedule_writes = {}
+        for record in records:
+            schedule_attr = schedule_blocks.get(record.attrid)
+            if schedule_attr is None:
+                other_records.append(record)
+            else:
+                schedule_writes.setdefault(schedule_attr, {})[record.attrid] = (
+                    record.value.value
+                )
+
+        manufacturer_attrs, sources = super()._map_write_records(other_records)
+        for schedule_attr, changes in schedule_writes.items():
+            manufacturer_attrs[schedule_attr] = self._compose_schedule(
+                schedule_attr, changes
             )
+            sources.setdefault(schedule_attr, []).extend(changes)
+        return manufacturer_attrs, sources
+
+    @classmethod
+    def _schedule_layouts(cls):
+        """Return the slots of each data144 schedule and the schedule of each slot.
+
+        Slots are (attribute id, default, scale, mask) tuples in byte order, i.e.
+        temperature, minute and hour of the last period first. The top bits of the
+        hours are flags.
+        """
+        layouts = cls.__dict__.get("_SCHEDULE_LAYOUTS")
+        if layouts is None:
+            fields = ((100, 0xFF), (1, 0xFF), (1, 0x3F))
+            slots = {
+                schedule_attr: tuple(
+                    (cls.attributes_by_name[name].id, default, *fields[index % 3])
+                    for index, (name, default) in enumerate(defaults.items())
+                )
+                for schedule_attr, defaults in (
+                    (MOES_SCHEDULE_WORKDAY_ATTR, cls.WORKDAY_SCHEDULE_ATTRS),
+                    (MOES_SCHEDULE_WEEKEND_ATTR, cls.WEEKEND_SCHEDULE_ATTRS),
+                )
+            }
+            blocks = {
+                slot[0]: schedule_attr
+                for schedule_attr, layout in slots.items()
+                for slot in layout
+            }
+            layouts = cls._SCHEDULE_LAYOUTS = (slots, blocks)
+        return layouts
+
+    def _compose_schedule(self, schedule_attr, changes):
+        """Compose a data144 schedule from the cached slots and the changed ones."""
+        data = data144()
+        for attrid, default, scale, _ in self._schedule_layouts()[0][schedule_attr]:
+            value = changes.get(attrid, self._attr_cache.get(attrid, default))
+            data.append(round(value / scale))
+        return data
 
 
 class MoesThermostatNew(MoesThermostat):
@@ -481,6 +481,11 @@ class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
 
     cluster_id = XBEE_IO_CLUSTER
 
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._analog_samples: dict[int, int] = {}
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -495,26 +500,30 @@ class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
         if hdr.command_id == SAMPLE_DATA_CMD:
             values = args.io_sample
             if "digital_samples" in values:
-                # Update digital inputs
-                active_pins = [
-                    i for i, x in enumerate(values["digital_samples"]) if x is not None
-                ]
-                for pin in active_pins:
+                # Update digital inputs whose state has changed
+                for pin, sample in enumerate(values["digital_samples"]):
+                    if sample is None:
+                        continue
+                    on_off = self._endpoint.device[0xD0 + pin].on_off
+                    if on_off.get(ATTR_ON_OFF) == sample:
+                        continue
                     # pylint: disable=W0212
-                    self._endpoint.device[0xD0 + pin].on_off._update_attribute(
-                        ATTR_ON_OFF, values["digital_samples"][pin]
-                    )
+                    on_off._update_attribute(ATTR_ON_OFF, sample)
             if "analog_samples" in values:
-                # Update analog inputs
-                active_pins = [
-                    i for i, x in enumerate(values["analog_samples"]) if x is not None
-                ]
-                for pin in active_pins:
+                # Update analog inputs that moved outside of the deadband
+                deadband = self._endpoint.device.analog_deadband
+                for pin, sample in enumerate(values["analog_samples"]):
+                    if sample is None:
+                        continue
+                    last = self._analog_samples.get(pin)
+                    if last is not None and abs(sample - last) <= deadband:
+                        continue
+                    self._analog_samples[pin] = sample
                     # pylint: disable=W0212
                     self._endpoint.device[0xD0 + pin].analog_input._update_attribute(
                         ATTR_PRESENT_VALUE,
-                        values["analog_samples"][pin]
-                        / (10.23 if pin != 7 else 1000),  # supply voltage is in mV
+                        # supply voltage is in mV
+                        sample / (10.23 if pin != 7 else 1000),
                     )
         else:
             super().handle_cluster_request(hdr, args)
@@ -619,6 +628,10 @@ class XBeeSerialDataCluster(LocalDataCluster):
 class XBeeCommon(CustomDevice):
     """XBee common class."""
 
+    # Raw analog sample change (ADC counts, mV for supply voltage) that is
+    # ignored, so that noisy inputs don't report on every sample
+    analog_deadband: int = 0
+
     def remote_at(self, command, *args, **kwargs):
         """Remote at command."""
         return (
@@ -6,6 +6,7 @@ from collections.abc import Iterable, Iterator
 import logging
 import math
 from typing import Any
+import weakref
 
 from zigpy import types as t
 import zigpy.device
@@ -39,6 +40,7 @@ from zhaquirks import (
     MotionOnEvent,
     OccupancyWithReset,
     QuickInitDevice,
+    message_rates,
 )
 from zhaquirks.const import (
     ATTRIBUTE_ID,
@@ -121,6 +123,12 @@ class XiaomiCustomDevice(CustomDevice):
         super().__init__(*args, **kwargs)
 
 
+# uninitialized device -> (model, quirks registered for it) when quick init failed
+_QUICK_INIT_MISSES: weakref.WeakKeyDictionary[
+    zigpy.device.Device, tuple[str, tuple[type, ...]]
+] = weakref.WeakKeyDictionary()
+
+
 class XiaomiQuickInitDevice(XiaomiCustomDevice, QuickInitDevice):
     """Xiaomi devices eligible for QuickInit."""
 
@@ -195,6 +203,7 @@ class XiaomiCluster(CustomCluster):
 
     def deserialize(self, data):
         """Deserialize cluster data."""
+        message_rates.record(self, message_rates.FRAMES)
         hdr, data = foundation.ZCLHeader.deserialize(data)
 
         # Only handle attribute reports differently
@@ -215,6 +224,20 @@ class XiaomiCluster(CustomCluster):
                 reports,
             )
 
+        # the values packed into Xiaomi attributes are counted once parsed
+        message_rates.record(
+            self,
+            message_rates.VALUES,
+            sum(
+                attr.attrid
+                not in (
+                    XIAOMI_AQARA_ATTRIBUTE,
+                    XIAOMI_MIJA_ATTRIBUTE,
+                    XIAOMI_AQARA_ATTRIBUTE_E1,
+                )
+                for attr in reports[0]
+            ),
+        )
         fixed_data = b"".join(attr.serialize() for attr in reports[0])
 
         return super().deserialize(hdr.serialize() + fixed_data)
@@ -225,6 +248,7 @@ class XiaomiCluster(CustomCluster):
             super()._update_attribute(attrid, value)
             if self.endpoint.device.model == "lumi.sensor_switch.aq2":
                 if value == b"\x04!\xa8C\n!\x00\x00":
+                    message_rates.record(self, message_rates.EVENTS)
                     self.listener_event(ZHA_SEND_EVENT, COMMAND_TRIPLE, [])
         elif attrid == XIAOMI_MIJA_ATTRIBUTE:
             attributes = self._parse_mija_attributes(value)
@@ -240,6 +264,7 @@ class XiaomiCluster(CustomCluster):
                 else:
                     attribute_name = UNKNOWN
 
+                message_rates.record(self, message_rates.EVENTS)
                 self.listener_event(
                     ZHA_SEND_EVENT,
                     COMMAND_ATTRIBUTE_UPDATED,
@@ -251,6 +276,7 @@ class XiaomiCluster(CustomCluster):
                 )
             return
 
+        message_rates.record(self, message_rates.VALUES, len(attributes))
         _LOGGER.debug(
             "%s - Xiaomi attribute report. attribute_id: [%s] value: [%s]",
             self.endpoint.device.ieee,
@@ -745,6 +771,13 @@ def handle_quick_init(
     if src_ep == 0:
         return
 
+    # skip devices that failed before, unless the quirks of their model changed
+    miss = _QUICK_INIT_MISSES.get(sender)
+    if miss is not None and miss[1] == tuple(
+        zigpy.quirks.get_quirk_list(LUMI, miss[0])
+    ):
+        return
+
     hdr, data = foundation.ZCLHeader.deserialize(message)
     sender.debug(
         """Received ZCL while uninitialized on endpoint id %s, cluster 0x%04x """
@@ -787,7 +820,8 @@ def handle_quick_init(
     if not model:
         return
 
-    for quirk in zigpy.quirks.get_quirk_list(LUMI, model):
+    quirks = tuple(zigpy.quirks.get_quirk_list(LUMI, model))
+    for quirk in quirks:
         if not issubclass(quirk, XiaomiQuickInitDevice):
             continue
 
@@ -800,6 +834,7 @@ def handle_quick_init(
             continue
         break
     else:
+        _QUICK_INIT_MISSES[sender] = (model, quirks)
         return
 
     sender.cancel_initialization()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import struct
 from typing import Any
 
 from zigpy import types
@@ -79,6 +80,19 @@ ZCL_TO_AQARA: dict[int, int] = {
     ZCL_ERROR_DETECTED: ERROR_DETECTED,
 }
 
+# header of a feeder attribute: 0x00, 0x02, sequence number and attribute id
+FEEDER_HEADER = struct.Struct(">BBBi")
+FEEDER_VALUE_FORMATS: dict[int, struct.Struct] = {
+    1: struct.Struct(">B"),
+    2: struct.Struct(">H"),
+    4: struct.Struct(">I"),
+}
+# value length of the settings written to the feeder, others are 1 byte long
+FEEDER_ATTR_LENGTHS: dict[int, int] = {
+    ZCL_SERVING_SIZE: 4,
+    ZCL_PORTION_WEIGHT: 4,
+}
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -192,47 +206,86 @@ class OppleCluster(XiaomiAqaraE1Cluster):
             length,
         )
         self._send_sequence = ((self._send_sequence or 0) + 1) % 256
-        val = bytes([0x00, 0x02, self._send_sequence])
+        sequence = self._send_sequence
         self._send_sequence += 1
-        val += types.int32s_be(attribute_id).serialize()
-        if length is not None and value is not None:
-            val += types.uint8_t(length).serialize()
-        if value is not None:
-            if length == 1:
-                val += types.uint8_t(value).serialize()
-            elif length == 2:
-                val += types.uint16_t_be(value).serialize()
-            elif length == 4:
-                val += types.uint32_t_be(value).serialize()
-            else:
-                val += value
+
+        value_format = FEEDER_VALUE_FORMATS.get(length) if value is not None else None
+        if value_format is not None:
+            value_size = value_format.size
+        elif value is not None:
+            value_size = len(value)
+        else:
+            value_size = 0
+        has_length = length is not None and value is not None
+
+        val = bytearray(FEEDER_HEADER.size + has_length + value_size)
+        FEEDER_HEADER.pack_into(val, 0, 0x00, 0x02, sequence, attribute_id)
+        if has_length:
+            val[FEEDER_HEADER.size] = length
+        if value_format is not None:
+            value_format.pack_into(val, FEEDER_HEADER.size + has_length, value)
+        elif value is not None:
+            val[FEEDER_HEADER.size + has_length :] = value
         LOGGER.debug(
             "OppleCluster.build_feeder_attribute: id: %s, cooked value: %s length: %s",
             attribute_id,
             val,
             length,
         )
-        return FEEDER_ATTR_NAME, val
+        return FEEDER_ATTR_NAME, bytes(val)
 
     async def write_attributes(
         self, attributes: dict[str | int, Any], manufacturer: int | None = None
     ) -> list:
-        """Write attributes to device with internal 'attributes' validation."""
+        """Write attributes to device with internal 'attributes' validation.
+
+        Feeder settings are queued and sent one frame each in order, waiting for
+        the device to acknowledge a frame before sending the next one. Each of
+        them gets its own status record in the result.
+        """
         attrs = {}
+        feeder_frames = []
         for attr, value in attributes.items():
             attr_def = self.find_attribute(attr)
             attr_id = attr_def.id
             if attr_id in ZCL_TO_AQARA:
-                attribute, cooked_value = self._build_feeder_attribute(
+                _, cooked_value = self._build_feeder_attribute(
                     ZCL_TO_AQARA[attr_id],
                     value,
-                    4 if attr_def.name in ["serving_size", "portion_weight"] else 1,
+                    FEEDER_ATTR_LENGTHS.get(attr_id, 1),
                 )
-                attrs[attribute] = cooked_value
+                feeder_frames.append((attr_id, cooked_value))
             else:
                 attrs[attr] = value
-        LOGGER.debug("OppleCluster.write_attributes: %s", attrs)
-        return await super().write_attributes(attrs, manufacturer)
+        LOGGER.debug("OppleCluster.write_attributes: %s %s", attrs, feeder_frames)
+
+        if not feeder_frames:
+            return await super().write_attributes(attrs, manufacturer)
+
+        records = []
+        if attrs:
+            result = await super().write_attributes(attrs, manufacturer)
+            records += [
+                record
+                for record in self._write_status_records(result)
+                if record.status != foundation.Status.SUCCESS
+            ]
+        for attr_id, cooked_value in feeder_frames:
+            result = await super().write_attributes(
+                {FEEDER_ATTR_NAME: cooked_value}, manufacturer
+            )
+            status = self._write_status_records(result)[0].status
+            records.append(foundation.WriteAttributesStatusRecord(status, attr_id))
+        return [records]
+
+    @staticmethod
+    def _write_status_records(
+        result: Any,
+    ) -> list[foundation.WriteAttributesStatusRecord]:
+        """Return the status records of a write, a default response is a failure."""
+        if result and isinstance(result[0], list) and result[0]:
+            return result[0]
+        return [foundation.WriteAttributesStatusRecord(foundation.Status.FAILURE)]
 
     async def write_attributes_raw(
         self, attrs: list[foundation.Attribute], manufacturer: int | None = None
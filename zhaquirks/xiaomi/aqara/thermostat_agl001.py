@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from functools import reduce
 import math
 import struct
 from typing import Any
@@ -248,55 +247,75 @@ class ScheduleEvent:
 class ScheduleSettings(t.LVBytes):
     """Schedule settings object."""
 
+    # magic byte, day selection and (time, reserved, temperature) of the 4 events
+    _LAYOUT = struct.Struct(">BB" + "HHH" * 4)
+
     def __new__(cls, value):
         """Create ScheduleSettings object from bytes or string."""
-        day_selection = None
-        events = [None] * 4
         if isinstance(value, bytes):
-            ScheduleSettings._verify_buffer_len(value)
-            ScheduleSettings._verify_magic_byte(value)
-            day_selection = ScheduleSettings._read_day_selection(value)
-            for i in range(4):
-                events[i] = ScheduleSettings._read_event(value, i)
+            day_selection, times, temps = ScheduleSettings._decode(value)
         elif isinstance(value, str):
-            groups = value.split("|")
-            ScheduleSettings._verify_string(groups)
-            day_selection = ScheduleSettings._read_day_selection(groups[0])
-            for i in range(4):
-                events[i] = ScheduleSettings._read_event(groups[i + 1], i)
+            day_selection, times, temps = ScheduleSettings._parse(value)
         else:
             raise TypeError(
                 f"Cannot create ScheduleSettings object from type: {type(value)}"
             )
 
-        for i in range(1, 4):
-            if events[i].get_time() < events[i - 1].get_time():
-                events[i].set_next_day(True)
-        ScheduleSettings._verify_event_durations(events)
-
-        result = bytearray(b"\x04")
-        result.append(ScheduleSettings._get_day_selection_byte(day_selection))
-        for e in events:
-            result.extend(e.serialize())
-        return super().__new__(cls, bytes(result))
+        ScheduleSettings._verify_events(times, temps)
+        return super().__new__(
+            cls, ScheduleSettings._encode(day_selection, times, temps)
+        )
 
     @staticmethod
-    def _verify_buffer_len(buf):
+    def _decode(buf):
+        """Decode the day selection byte, event times and temperatures in one pass.
+
+        Times are in minutes and temperatures in hundredths of degrees.
+        """
         if len(buf) != 26:
             raise ValueError("Buffer size must equal 26")
-
-    @staticmethod
-    def _verify_magic_byte(buf):
-        if struct.unpack_from("c", buf, offset=0)[0][0] != 0x04:
+        magic, day_selection, *fields = ScheduleSettings._LAYOUT.unpack(buf)
+        if magic != 0x04:
             raise ValueError("Magic byte must be equal to 0x04")
+        if day_selection & 0x01:
+            raise ValueError("Incorrect day selected")
+        if not day_selection:
+            raise ValueError("Number of days selected must be between 1 and 7")
+        times = [time & ~NEXT_DAY_FLAG for time in fields[0::3]]
+        return day_selection, times, fields[2::3]
 
     @staticmethod
-    def _verify_string(groups):
+    def _parse(string):
+        """Parse the day selection byte, event times and temperatures of a string."""
+        groups = string.split("|")
         if len(groups) != 5:
             raise ValueError("There must be 5 groups in a string")
         days = groups[0].split(",")
         ScheduleSettings._verify_day_selection_in_str(days)
 
+        times = []
+        temps = []
+        for event in groups[1:]:
+            parts = event.split(",")
+            if len(parts) != 2:
+                raise ValueError("Time and temperature must contain ',' separator")
+            temp = ScheduleEvent._parse_temp(parts[1])
+            ScheduleEvent._validate_temp(temp)
+            times.append(ScheduleEvent._parse_time(parts[0]))
+            temps.append(int(temp * 100))
+        return ScheduleSettings._get_day_selection_byte(days), times, temps
+
+    @staticmethod
+    def _encode(day_selection, times, temps):
+        """Encode the day selection byte, event times and temperatures."""
+        fields = []
+        prev_time = times[0]
+        for time, temp in zip(times, temps, strict=True):
+            # events earlier than the previous one are on the next day
+            fields += (time | NEXT_DAY_FLAG if time < prev_time else time, 0, temp)
+            prev_time = time
+        return ScheduleSettings._LAYOUT.pack(0x04, day_selection, *fields)
+
     @staticmethod
     def _verify_day_selection_in_str(days):
         if len(days) == 0 or len(days) > 7:
@@ -310,44 +329,27 @@ class ScheduleSettings(t.LVBytes):
                 )
 
     @staticmethod
-    def _read_day_selection(value):
-        day_selection = []
-        if isinstance(value, bytes):
-            byte = struct.unpack_from("c", value, offset=1)[0][0]
-            if byte & 0x01:
-                raise ValueError("Incorrect day selected")
-            for i, v in DAYS_MAP.items():
-                if byte & v:
-                    day_selection.append(i)
-            ScheduleSettings._verify_day_selection_in_str(day_selection)
-        elif isinstance(value, str):
-            day_selection = value.split(",")
-            ScheduleSettings._verify_day_selection_in_str(day_selection)
-        return day_selection
-
-    @staticmethod
-    def _read_event(value, index):
-        if isinstance(value, bytes):
-            event_buf = value[2 + index * 6 : 8 + index * 6]
-            return ScheduleEvent(event_buf)
-        elif isinstance(value, str):
-            return ScheduleEvent(value)
-
-    @staticmethod
-    def _verify_event_durations(events):
+    def _verify_events(times, temps):
+        """Validate all event times, temperatures and durations in one sweep."""
         full_day = 24 * 60
-        prev_time = events[0].get_time()
-        durations = []
-        for i in range(1, 4):
-            event = events[i]
-            if event.is_next_day():
-                durations.append(full_day - prev_time + event.get_time())
-            else:
-                durations.append(event.get_time() - prev_time)
-            prev_time = event.get_time()
-        if any(d < 60 for d in durations):
-            raise ValueError("The individual times must be at least 1 hour apart")
-        if reduce((lambda x, y: x + y), durations) > full_day:
+        total = 0
+        prev_time = times[0]
+        for index, (time, temp) in enumerate(zip(times, temps, strict=True)):
+            if not 0 < time <= full_day:
+                raise ValueError("Time must be between 00:00 and 23:59")
+            if not 500 <= temp <= 3000:
+                raise ValueError("Temperature must be between 5 and 30 °C")
+            if temp % 50:
+                raise ValueError("Temperature must be whole or half degrees")
+            if index:
+                duration = (time - prev_time) % full_day
+                if duration < 60:
+                    raise ValueError(
+                        "The individual times must be at least 1 hour apart"
+                    )
+                total += duration
+            prev_time = time
+        if total > full_day:
             raise ValueError("The start and end times must be at most 24 hours apart")
 
     @staticmethod
@@ -359,13 +361,10 @@ class ScheduleSettings(t.LVBytes):
 
     def __str__(self):
         """Return ScheduleSettings as string."""
-        day_selection = ScheduleSettings._read_day_selection(self)
-        events = [None] * 4
-        for i in range(4):
-            events[i] = ScheduleSettings._read_event(self, i)
-        result = ",".join(day_selection)
-        for e in events:
-            result += f"|{e}"
+        day_selection, times, temps = ScheduleSettings._decode(self)
+        result = ",".join(day for day, bit in DAYS_MAP.items() if day_selection & bit)
+        for time, temp in zip(times, temps, strict=True):
+            result += f"|{time // 60}:{time % 60:0>2},{temp / 100:.1f}"
         return result
 
 
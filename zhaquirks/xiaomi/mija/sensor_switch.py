@@ -1,7 +1,5 @@
 """Xiaomi mija button device."""
 
-import asyncio
-
 from zigpy.profiles import zha
 from zigpy.zcl.clusters.general import (
     Basic,
@@ -13,7 +11,7 @@ from zigpy.zcl.clusters.general import (
     Scenes,
 )
 
-from zhaquirks import CustomCluster
+from zhaquirks import CustomCluster, reset_timer_wheel
 from zhaquirks.const import (
     ARGS,
     BUTTON,
@@ -80,8 +78,7 @@ class MijaButton(XiaomiQuickInitDevice):
         def __init__(self, *args, **kwargs):
             """Init."""
             self._current_state = {}
-            self._loop = asyncio.get_running_loop()
-            self._timer_handle = None
+            self._hold_timer = reset_timer_wheel()
             super().__init__(*args, **kwargs)
 
         def _update_attribute(self, attrid, value):
@@ -92,14 +89,10 @@ class MijaButton(XiaomiQuickInitDevice):
                 value = not value
 
                 if value:
-                    if self._timer_handle:
-                        self._timer_handle.cancel()
-                    self._timer_handle = self._loop.call_later(
-                        self.hold_duration, self._hold_timeout
+                    self._hold_timer.schedule(
+                        self, self.hold_duration, self._hold_timeout
                     )
-                elif self._timer_handle:
-                    self._timer_handle.cancel()
-                    self._timer_handle = None
+                elif self._hold_timer.cancel(self):
                     click_type = COMMAND_SINGLE
                 else:
                     self.listener_event(ZHA_SEND_EVENT, COMMAND_RELEASE, [])
@@ -118,7 +111,6 @@ class MijaButton(XiaomiQuickInitDevice):
         def _hold_timeout(self):
             """Handle hold timeout."""
 
-            self._timer_handle = None
             self.listener_event(ZHA_SEND_EVENT, COMMAND_HOLD, [])
 
     signature = {